@@ -8,6 +8,7 @@ import datetime # <--- ADDED IMPORT
 # Use absolute imports starting from the top-level package 'ai_researcher'
 from ai_researcher.agentic_layer.model_dispatcher import ModelDispatcher
 from ai_researcher.agentic_layer.tool_registry import ToolRegistry
+from ai_researcher.agentic_layer.utils.json_format_helper import should_retry_with_json_object
 
 # Define the standard output structure for agent run methods
 # result_dict: The primary output data (e.g., plan, notes, text content, messenger response dict)
@@ -62,6 +63,7 @@ class BaseAgent(ABC):
         log_queue: Optional[Any] = None, # <-- Add log_queue parameter for UI updates
         update_callback: Optional[Any] = None, # <-- Add update_callback parameter for UI updates
         log_llm_call: bool = True, # <-- Add parameter to control LLM call logging
+        raise_schema_errors: bool = False, # Re-raise json_schema rejections so the caller can fall back to json_object
         **kwargs: Any # Accept arbitrary keyword arguments
     ) -> Tuple[Optional[Any], Optional[Dict[str, Any]]]: # Return type: (ChatCompletion, model_details_dict) or (None, None)
         """
@@ -71,6 +73,10 @@ class BaseAgent(ABC):
              A tuple containing:
              - The raw response object from the LLM client (e.g., ChatCompletion) or None on failure.
              - A dictionary with model call details or None on failure.
+
+        Raises:
+             The dispatcher's exception if raise_schema_errors is set and the error indicates
+             the provider rejected the requested response_format (see should_retry_with_json_object).
         """
         if not self.model_dispatcher:
              print(f"{self.agent_name} Error: ModelDispatcher is not initialized.")
@@ -304,6 +310,8 @@ class BaseAgent(ABC):
 
             return response, model_call_details # Return the tuple
         except Exception as e:
+            if raise_schema_errors and should_retry_with_json_object(e):
+                raise
             print(f"{self.agent_name} Error: Failed to get response from LLM via ModelDispatcher: {e}")
             # Consider logging the full traceback here
             # import traceback
@@ -1,25 +1,119 @@
+import hashlib
 import logging
 import re
-from typing import Optional, List, Dict, Any, Tuple
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple, Final
 
 from pydantic import ValidationError
 
 # Import the JSON utilities
 from ai_researcher.agentic_layer.utils.json_utils import (
+    fast_json_loads,
     parse_llm_json_response,
     prepare_for_pydantic_validation
 )
+from ai_researcher.agentic_layer.utils.json_format_helper import (
+    get_json_schema_format,
+    get_json_object_format,
+    should_retry_with_json_object
+)
 
 # Use absolute imports starting from the top-level package 'ai_researcher'
 from ai_researcher.agentic_layer.agents.base_agent import BaseAgent
 from ai_researcher.agentic_layer.model_dispatcher import ModelDispatcher
 from ai_researcher import config
-from ai_researcher.agentic_layer.schemas.notes import Note, NotesCritiqueOutput, VerificationStatus
+from ai_researcher.agentic_layer.schemas.notes import (
+    Note, NotesCritiqueOutput, NotesCritiqueBatchOutput, VerificationStatus, NOTES_CRITIQUE_ADAPTER
+)
 from ai_researcher.agentic_layer.schemas.goal import GoalEntry
 from ai_researcher.agentic_layer.schemas.thought import ThoughtEntry
 
 logger = logging.getLogger(__name__)
 
+# Schema-constrained response formats, generated once. Not strict: the critique schema has
+# optional fields, which strict structured outputs reject.
+_CRITIQUE_RESPONSE_FORMAT: Final[Dict[str, Any]] = get_json_schema_format(
+    NotesCritiqueOutput, schema_name="notes_critique_output", strict=False
+)
+_BATCH_CRITIQUE_RESPONSE_FORMAT: Final[Dict[str, Any]] = get_json_schema_format(
+    NotesCritiqueBatchOutput, schema_name="notes_critique_batch_output", strict=False
+)
+
+# Maximum number of critiques kept in the per-agent content-hash cache
+CRITIQUE_CACHE_SIZE = 1024
+
+# Extracts the JSON object from a ```json fenced block. Greedy so nested objects are kept whole.
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*\})\s*```', re.DOTALL)
+
+# --- Prompt scaffolding (constant across notes; formatted once per call) ---
+_SYSTEM_PROMPT: Final[str] = """You are a meticulous Research Auditor. Your task is to verify the quality, accuracy, and alignment of a research note against its source material and the mission's goals. You do not generate new content; you rigorously critique existing content.
+
+Your primary responsibilities are:
+1. **Hallucination Detection:** Verify if the note's claims are supported by the provided 'Source Context'. Flag any information that is not present in the source.
+2. **Source Alignment:** Ensure the note accurately reflects the source's meaning without distortion or omission of critical context.
+3. **Goal Alignment:** Check if the note is relevant to the 'Section Goal' and 'Active Mission Goals'.
+4. **Quality Check:** Evaluate if the note is clear, concise, and properly structured.
+
+Based on your audit, provide:
+1. An 'overall_assessment' of the note.
+2. A 'source_alignment' report (aligned: bool, coverage %, unsupported claims).
+3. A list of 'hallucinations_detected' (if any).
+4. 'suggested_refinements' to improve accuracy or clarity.
+5. A 'verification_status' (passed, revise, unchecked).
+6. A 'scratchpad_update' and 'generated_thought'.
+
+Output ONLY a JSON object conforming to the NotesCritiqueOutput schema.
+"""
+
+_NOTE_BLOCK_TEMPLATE: Final[str] = """Note to Verify:
+---
+ID: {note_id}
+Content: {content}
+Structured Analysis: {structured_analysis}
+---
+
+Source Snippet/Content:
+---
+{snippet}
+Source ID: {source_id}
+Title: {title}
+---
+"""
+
+_SUSPECT_CLAIMS_TEMPLATE: Final[str] = """
+Claims Not Found in the Source Snippet (a local word-overlap check could not match these; verify them first):
+{claims}
+"""
+
+_GOALS_TEMPLATE: Final[str] = "\nActive Mission Goals:\n---\n{goals}\n---\n"
+_SCRATCHPAD_TEMPLATE: Final[str] = "\nCurrent Agent Scratchpad:\n---\n{scratchpad}\n---\n"
+_THOUGHTS_TEMPLATE: Final[str] = "\nRecent Thoughts:\n---\n{thoughts}\n---\n"
+
+_MISSION_CONTEXT_TEMPLATE: Final[str] = """Section Goal:
+{section_goal}
+
+{goals}
+{scratchpad}
+{thoughts}"""
+
+_CRITIQUE_PROMPT_TEMPLATE: Final[str] = """Please critique the following research note.
+
+{note_block}
+
+{mission_context}
+
+Task: Verify the note's accuracy against the source snippet, check for hallucinations, and assess relevance to the section goal. Output ONLY a JSON object conforming to the NotesCritiqueOutput schema.
+"""
+
+_BATCH_CRITIQUE_PROMPT_TEMPLATE: Final[str] = """Please critique each of the following {note_count} research notes independently.
+
+{note_blocks}
+
+{mission_context}
+
+Task: For EACH note, verify its accuracy against its own source snippet, check for hallucinations, and assess relevance to the section goal. Output ONLY a JSON object of the form {{"critiques": [...]}}, where the list contains exactly one NotesCritiqueOutput object per note, each with 'note_id' set to the ID of the note it critiques.
+"""
+
 class NotesCriticAgent(BaseAgent):
     """
     Agent responsible for critiquing notes, verifying accuracy against sources,
@@ -61,27 +155,167 @@ class NotesCriticAgent(BaseAgent):
         )
         self.controller = controller
         self.mission_id = None
+        # LRU cache of critiques keyed by a hash of (content, structured analysis, snippet, section goal);
+        # overlapping RAG chunks often yield notes that would otherwise be critiqued repeatedly
+        self._critique_cache: "OrderedDict[str, NotesCritiqueOutput]" = OrderedDict()
+        # Cleared the first time the provider rejects json_schema output (a schema error, not
+        # a transient failure), after which critiques use plain JSON mode
+        self._json_schema_supported = True
 
     def _default_system_prompt(self) -> str:
-        """Generates the default system prompt for the Notes Critic Agent."""
-        return """You are a meticulous Research Auditor. Your task is to verify the quality, accuracy, and alignment of a research note against its source material and the mission's goals. You do not generate new content; you rigorously critique existing content.
+        """Returns the default system prompt for the Notes Critic Agent."""
+        return _SYSTEM_PROMPT
 
-Your primary responsibilities are:
-1. **Hallucination Detection:** Verify if the note's claims are supported by the provided 'Source Context'. Flag any information that is not present in the source.
-2. **Source Alignment:** Ensure the note accurately reflects the source's meaning without distortion or omission of critical context.
-3. **Goal Alignment:** Check if the note is relevant to the 'Section Goal' and 'Active Mission Goals'.
-4. **Quality Check:** Evaluate if the note is clear, concise, and properly structured.
+    def _format_note_block(self, note: Note, suspect_claims: Optional[List[str]] = None) -> str:
+        """
+        Formats a note and its source snippet for inclusion in a critique prompt,
+        followed by any claims the local source-alignment check flagged.
+        """
+        note_block = _NOTE_BLOCK_TEMPLATE.format_map({
+            "note_id": note.note_id,
+            "content": note.content,
+            "structured_analysis": note.structured_analysis if note.structured_analysis else 'None',
+            "snippet": note.source_metadata.snippet or "(No source snippet available)",
+            "source_id": note.source_id,
+            "title": note.source_metadata.title,
+        })
+        if suspect_claims:
+            note_block += _SUSPECT_CLAIMS_TEMPLATE.format_map({
+                "claims": "\n".join(f"- {claim}" for claim in suspect_claims)
+            })
+        return note_block
 
-Based on your audit, provide:
-1. An 'overall_assessment' of the note.
-2. A 'source_alignment' report (aligned: bool, coverage %, unsupported claims).
-3. A list of 'hallucinations_detected' (if any).
-4. 'suggested_refinements' to improve accuracy or clarity.
-5. A 'verification_status' (passed, revise, unchecked).
-6. A 'scratchpad_update' and 'generated_thought'.
+    @staticmethod
+    def format_goals(active_goals: Optional[List[GoalEntry]]) -> str:
+        """Formats active goals as a bulleted list ("None" if empty)."""
+        return "\n".join([f"- {g.text}" for g in active_goals]) if active_goals else "None"
 
-Output ONLY a JSON object conforming to the NotesCritiqueOutput schema.
-"""
+    @staticmethod
+    def format_thoughts(active_thoughts: Optional[List[ThoughtEntry]]) -> str:
+        """Formats recent thoughts as a bulleted list (empty string if none)."""
+        return "\n".join([f"- {t.content}" for t in active_thoughts]) if active_thoughts else ""
+
+    def _format_mission_context(
+        self,
+        section_goal: str,
+        active_goals: Optional[List[GoalEntry]] = None,
+        active_thoughts: Optional[List[ThoughtEntry]] = None,
+        agent_scratchpad: Optional[str] = None,
+        goals_str: Optional[str] = None,
+        thoughts_str: Optional[str] = None
+    ) -> str:
+        """
+        Formats the section goal, mission goals, scratchpad and thoughts shared by all notes.
+        Precomputed goals_str/thoughts_str take precedence over rebuilding from the entries.
+        """
+        if goals_str is None:
+            goals_str = self.format_goals(active_goals)
+        if thoughts_str is None:
+            thoughts_str = self.format_thoughts(active_thoughts)
+
+        return _MISSION_CONTEXT_TEMPLATE.format_map({
+            "section_goal": section_goal,
+            "goals": _GOALS_TEMPLATE.format(goals=goals_str),
+            "scratchpad": _SCRATCHPAD_TEMPLATE.format(scratchpad=agent_scratchpad) if agent_scratchpad else "",
+            "thoughts": _THOUGHTS_TEMPLATE.format(thoughts=thoughts_str) if thoughts_str else "",
+        })
+
+    @staticmethod
+    def _critique_cache_key(note: Note, section_goal: str) -> str:
+        """Builds the cache key for a note's critique from the inputs that determine it."""
+        hasher = hashlib.blake2b(digest_size=16)
+        structured_analysis = note.structured_analysis.model_dump_json() if note.structured_analysis else ""
+        for part in (note.content, structured_analysis, note.source_metadata.snippet or "", section_goal or ""):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\x00")
+        return hasher.hexdigest()
+
+    def _get_cached_critique(self, note: Note, section_goal: str) -> Optional[NotesCritiqueOutput]:
+        """Returns a copy of a cached critique re-targeted at this note, or None on a miss."""
+        key = self._critique_cache_key(note, section_goal)
+        cached = self._critique_cache.get(key)
+        if cached is None:
+            return None
+        self._critique_cache.move_to_end(key)
+        return cached.model_copy(update={"note_id": note.note_id})
+
+    def _store_cached_critique(self, note: Note, section_goal: str, critique: NotesCritiqueOutput) -> None:
+        """Stores a critique in the LRU cache, evicting the oldest entry when full."""
+        key = self._critique_cache_key(note, section_goal)
+        self._critique_cache[key] = critique
+        self._critique_cache.move_to_end(key)
+        if len(self._critique_cache) > CRITIQUE_CACHE_SIZE:
+            self._critique_cache.popitem(last=False)
+
+    async def _call_critique_llm(
+        self,
+        prompt: str,
+        response_format: Dict[str, Any],
+        log_queue: Optional[Any] = None,
+        update_callback: Optional[Any] = None
+    ) -> Tuple[Optional[Any], Optional[Dict[str, Any]], bool]:
+        """
+        Requests a critique with schema-constrained output, falling back to json_object mode
+        if the provider rejects the schema.
+        Returns (response, model_call_details, constrained) where constrained says whether
+        the response was generated against the schema.
+        """
+        if self._json_schema_supported:
+            try:
+                response, model_call_details = await self._call_llm(
+                    user_prompt=prompt,
+                    agent_mode="notes_critic",
+                    response_format=response_format,
+                    log_queue=log_queue,
+                    update_callback=update_callback,
+                    raise_schema_errors=True
+                )
+                # Other failures (rate limits, connection errors) come back as (None, None) and
+                # are not a reason to give up on schema mode
+                return response, model_call_details, True
+            except Exception as e:
+                if not should_retry_with_json_object(e):
+                    raise
+                logger.warning(f"{self.agent_name}: Provider rejected json_schema output ({str(e)[:200]}); falling back to json_object format.")
+                self._json_schema_supported = False
+
+        response, model_call_details = await self._call_llm(
+            user_prompt=prompt,
+            agent_mode="notes_critic",
+            response_format=get_json_object_format(),
+            log_queue=log_queue,
+            update_callback=update_callback
+        )
+        return response, model_call_details, False
+
+    @staticmethod
+    def _parse_critique_json(json_str: str, constrained: bool) -> Any:
+        """
+        Parses a critique response. Schema-constrained output is parsed directly; anything
+        else (or constrained output that still fails to parse) goes through fence stripping
+        and the tolerant LLM JSON parser.
+        """
+        if constrained:
+            try:
+                return fast_json_loads(json_str)
+            except ValueError:
+                pass
+        if '```' in json_str:
+            match = _JSON_FENCE_RE.search(json_str)
+            if match:
+                json_str = match.group(1)
+        return parse_llm_json_response(json_str)
+
+    def _validate_critique(self, critique_data: Dict[str, Any], note_id: str) -> NotesCritiqueOutput:
+        """
+        Validates a single parsed critique dict against the NotesCritiqueOutput schema.
+        This is the untrusted LLM boundary; internal code that already holds a validated
+        critique should pass the instance along rather than rebuilding it.
+        """
+        # Ensure note_id matches
+        critique_data['note_id'] = note_id
+        prepared_data = prepare_for_pydantic_validation(critique_data, NotesCritiqueOutput)
+        return NOTES_CRITIQUE_ADAPTER.validate_python(prepared_data)
 
     async def run(
         self,
@@ -92,82 +326,50 @@ Output ONLY a JSON object conforming to the NotesCritiqueOutput schema.
         agent_scratchpad: Optional[str] = None,
         mission_id: Optional[str] = None,
         log_queue: Optional[Any] = None,
-        update_callback: Optional[Any] = None
+        update_callback: Optional[Any] = None,
+        goals_str: Optional[str] = None,
+        thoughts_str: Optional[str] = None,
+        suspect_claims: Optional[List[str]] = None
     ) -> Tuple[Optional[NotesCritiqueOutput], Optional[Dict[str, Any]], Optional[str]]:
         """
         Critiques a note against its source and goals.
+        goals_str/thoughts_str may be precomputed by the caller when critiquing many notes.
+        suspect_claims are claims a local check could not match to the source snippet.
         """
         self.mission_id = mission_id
         
+        cached = self._get_cached_critique(note, section_goal)
+        if cached is not None:
+            logger.info(f"{self.agent_name}: Reusing cached critique for note {note.note_id}. Status: {cached.verification_status}")
+            return cached, None, None
+
         logger.info(f"{self.agent_name}: Critiquing note {note.note_id} (source: {note.source_id})...")
         scratchpad_update = None
 
-        # Prepare context
-        scratchpad_context = f"\nCurrent Agent Scratchpad:\n---\n{agent_scratchpad}\n---\n" if agent_scratchpad else ""
-        
-        goals_str = "\n".join([f"- {g.text}" for g in active_goals]) if active_goals else "None"
-        active_goals_context = f"\nActive Mission Goals:\n---\n{goals_str}\n---\n"
-        
-        thoughts_context = ""
-        if active_thoughts:
-            thoughts_str = "\n".join([f"- {t.content}" for t in active_thoughts])
-            thoughts_context = f"\nRecent Thoughts:\n---\n{thoughts_str}\n---\n"
-
-        # Source context from note metadata
-        source_context = "Source Snippet/Content:\n---\n"
-        if note.source_metadata.snippet:
-             source_context += f"{note.source_metadata.snippet}\n"
-        else:
-             source_context += "(No source snippet available)\n"
-        source_context += f"Source ID: {note.source_id}\nTitle: {note.source_metadata.title}\n---\n"
-
-        prompt = f"""Please critique the following research note.
-
-Note to Verify:
----
-ID: {note.note_id}
-Content: {note.content}
-Structured Analysis: {note.structured_analysis if note.structured_analysis else 'None'}
----
-
-{source_context}
-
-Section Goal:
-{section_goal}
+        note_block = self._format_note_block(note, suspect_claims)
+        mission_context = self._format_mission_context(
+            section_goal, active_goals, active_thoughts, agent_scratchpad,
+            goals_str=goals_str, thoughts_str=thoughts_str
+        )
 
-{active_goals_context}
-{scratchpad_context}
-{thoughts_context}
+        prompt = _CRITIQUE_PROMPT_TEMPLATE.format_map({
+            "note_block": note_block,
+            "mission_context": mission_context,
+        })
 
-Task: Verify the note's accuracy against the source snippet, check for hallucinations, and assess relevance to the section goal. Output ONLY a JSON object conforming to the NotesCritiqueOutput schema.
-"""
-
-        messages = [{"role": "user", "content": prompt}]
         model_call_details = None
         
         try:
-            response, model_call_details = await self._call_llm(
-                user_prompt=prompt,
-                agent_mode="notes_critic",
-                response_format={"type": "json_object"},
-                log_queue=log_queue,
-                update_callback=update_callback
+            response, model_call_details, constrained = await self._call_critique_llm(
+                prompt, _CRITIQUE_RESPONSE_FORMAT, log_queue, update_callback
             )
 
             if response and response.choices and response.choices[0].message.content:
-                json_str = response.choices[0].message.content
-                match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', json_str, re.DOTALL)
-                if match:
-                    json_str = match.group(1)
-
                 try:
-                    parsed_json = parse_llm_json_response(json_str)
-                    # Ensure note_id matches
-                    parsed_json['note_id'] = note.note_id 
-                    
-                    prepared_data = prepare_for_pydantic_validation(parsed_json, NotesCritiqueOutput)
-                    response_model = NotesCritiqueOutput(**prepared_data)
+                    parsed_json = self._parse_critique_json(response.choices[0].message.content, constrained)
+                    response_model = self._validate_critique(parsed_json, note.note_id)
                     scratchpad_update = response_model.scratchpad_update
+                    self._store_cached_critique(note, section_goal, response_model)
                     
                     logger.info(f"{self.agent_name}: Critique complete. Status: {response_model.verification_status}")
                     return response_model, model_call_details, scratchpad_update
@@ -181,3 +383,115 @@ Task: Verify the note's accuracy against the source snippet, check for hallucina
         except Exception as e:
             logger.error(f"{self.agent_name}: Error during critique: {e}", exc_info=True)
             return None, model_call_details, scratchpad_update
+
+    async def run_batch(
+        self,
+        notes: List[Note],
+        section_goal: str,
+        active_goals: Optional[List[GoalEntry]] = None,
+        active_thoughts: Optional[List[ThoughtEntry]] = None,
+        agent_scratchpad: Optional[str] = None,
+        mission_id: Optional[str] = None,
+        log_queue: Optional[Any] = None,
+        update_callback: Optional[Any] = None,
+        goals_str: Optional[str] = None,
+        thoughts_str: Optional[str] = None,
+        suspect_claims: Optional[Dict[str, List[str]]] = None
+    ) -> Tuple[List[NotesCritiqueOutput], Optional[Dict[str, Any]], Optional[str], List[Note]]:
+        """
+        Critiques several notes in a single LLM request.
+        suspect_claims maps note_id to the claims a local check could not match to the source snippet.
+
+        Returns (critiques, model_call_details, scratchpad_update, missed_notes). critiques holds
+        the critiques that were returned and validated (or served from the cache), keyed back to
+        their notes by note_id. missed_notes are the notes a parsed response skipped or whose
+        critique failed validation, which callers can retry individually. If the request itself
+        failed or its response could not be parsed, missed_notes is empty and the uncritiqued
+        notes are simply absent from critiques.
+        """
+        self.mission_id = mission_id
+
+        scratchpad_update = None
+        critiques: List[NotesCritiqueOutput] = []
+
+        # Serve repeated notes from the cache and only send the rest to the LLM
+        uncached_notes: List[Note] = []
+        for note in notes:
+            cached = self._get_cached_critique(note, section_goal)
+            if cached is not None:
+                critiques.append(cached)
+            else:
+                uncached_notes.append(note)
+        if critiques:
+            logger.info(f"{self.agent_name}: Reusing {len(critiques)} cached critiques in batch.")
+        if not uncached_notes:
+            return critiques, None, scratchpad_update, []
+        notes = uncached_notes
+
+        logger.info(f"{self.agent_name}: Critiquing batch of {len(notes)} notes...")
+
+        notes_by_id = {note.note_id: note for note in notes}
+        note_blocks = "\n".join(
+            f"[Note {i} of {len(notes)}]\n{self._format_note_block(note, (suspect_claims or {}).get(note.note_id))}"
+            for i, note in enumerate(notes, start=1)
+        )
+        mission_context = self._format_mission_context(
+            section_goal, active_goals, active_thoughts, agent_scratchpad,
+            goals_str=goals_str, thoughts_str=thoughts_str
+        )
+
+        prompt = _BATCH_CRITIQUE_PROMPT_TEMPLATE.format_map({
+            "note_count": len(notes),
+            "note_blocks": note_blocks,
+            "mission_context": mission_context,
+        })
+
+        model_call_details = None
+
+        try:
+            response, model_call_details, constrained = await self._call_critique_llm(
+                prompt, _BATCH_CRITIQUE_RESPONSE_FORMAT, log_queue, update_callback
+            )
+
+            if response and response.choices and response.choices[0].message.content:
+                try:
+                    parsed_json = self._parse_critique_json(response.choices[0].message.content, constrained)
+                except Exception as e:
+                    logger.error(f"{self.agent_name}: Failed to parse batch response: {e}", exc_info=True)
+                    return critiques, model_call_details, scratchpad_update, []
+
+                # Accept a bare list as well as the requested {"critiques": [...]} wrapper
+                critique_items = parsed_json.get("critiques", []) if isinstance(parsed_json, dict) else parsed_json
+                if not isinstance(critique_items, list):
+                    logger.error(f"{self.agent_name}: Batch response did not contain a list of critiques.")
+                    return critiques, model_call_details, scratchpad_update, []
+
+                seen_ids = set()
+                for item in critique_items:
+                    if not isinstance(item, dict):
+                        continue
+                    note_id = item.get("note_id")
+                    if note_id not in notes_by_id or note_id in seen_ids:
+                        logger.warning(f"{self.agent_name}: Ignoring critique for unexpected or duplicate note_id '{note_id}'.")
+                        continue
+                    try:
+                        response_model = self._validate_critique(item, note_id)
+                    except Exception as e:
+                        logger.error(f"{self.agent_name}: Failed to validate critique for note {note_id}: {e}")
+                        continue
+                    seen_ids.add(note_id)
+                    critiques.append(response_model)
+                    self._store_cached_critique(notes_by_id[note_id], section_goal, response_model)
+                    if response_model.scratchpad_update:
+                        scratchpad_update = response_model.scratchpad_update
+
+                missed_notes = [note for note in notes if note.note_id not in seen_ids]
+                logger.info(f"{self.agent_name}: Batch critique complete. {len(seen_ids)}/{len(notes)} notes critiqued.")
+                return critiques, model_call_details, scratchpad_update, missed_notes
+            else:
+                logger.error(f"{self.agent_name}: LLM call failed.")
+                return critiques, model_call_details, scratchpad_update, []
+
+        except Exception as e:
+            logger.error(f"{self.agent_name}: Error during batch critique: {e}", exc_info=True)
+            return critiques, model_call_details, scratchpad_update, []
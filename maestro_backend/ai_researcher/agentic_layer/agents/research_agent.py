@@ -32,7 +32,7 @@ from ai_researcher.agentic_layer.tool_registry import ToolRegistry
 from ai_researcher.core_rag.query_preparer import QueryPreparer, QueryRewritingTechnique # <-- Import QueryPreparer
 from ai_researcher.agentic_layer.schemas.planning import PlanStep, ActionType, ReportSection
 from ai_researcher.agentic_layer.schemas.research import ResearchFindings, ResearchResultResponse, Source
-from ai_researcher.agentic_layer.schemas.notes import Note, NoteType, NoteAnalysis
+from ai_researcher.agentic_layer.schemas.notes import Note, NoteType, NoteAnalysis, NOTE_ADAPTER
 from ai_researcher.agentic_layer.schemas.goal import GoalEntry # Import GoalEntry
 from ai_researcher.agentic_layer.schemas.thought import ThoughtEntry # Added import
 # from ai_researcher.agentic_layer.context_manager import ContextManager
@@ -2348,7 +2348,7 @@ You MUST output a JSON object with the following structure. Pay close attention
                         parsed_note_data["structured_analysis"] = NoteAnalysis(**sa_value)
                 # --- End transformation ---
 
-                generated_note = Note(**parsed_note_data)
+                generated_note = NOTE_ADAPTER.validate_python(parsed_note_data)
                 
                 logger.info(f"Successfully generated structured note {generated_note.note_id} of type {generated_note.note_type.name}.")
                 
@@ -1,7 +1,7 @@
 import json
 import uuid
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Literal, Callable, Set 
+from typing import Dict, Any, Optional, List, Literal, Callable, Set, Tuple
 from pydantic import BaseModel, Field, ValidationError
 import datetime
 import logging
@@ -249,6 +249,9 @@ class AsyncContextManager:
         self._mission_semaphores: Dict[str, asyncio.Semaphore] = {}
         self.tracked_calls: Set[str] = set() # Track call IDs to prevent double counting
         # --- End NEW State ---
+        # Index of unchecked notes per mission: (notes list it was built from, note_id -> Note).
+        # Rebuilt lazily whenever mission.notes is replaced by a different list object.
+        self._unchecked_notes: Dict[str, Tuple[List[Note], Dict[str, Note]]] = {}
         
         logger.info("AsyncContextManager initialized. Call async_init() to load missions from database.")
 
@@ -451,6 +454,7 @@ class AsyncContextManager:
             # Clean up semaphore if exists
             if mission_id in self._mission_semaphores:
                 del self._mission_semaphores[mission_id]
+            self._unchecked_notes.pop(mission_id, None)
             
             # Cancel any async tasks
             from ai_researcher.agentic_layer.controller.utils.async_task_manager import get_task_manager
@@ -848,6 +852,8 @@ class AsyncContextManager:
         mission = self.get_mission_context(mission_id)
         if mission:
             mission.notes.append(note)
+            if note.verification_status == VerificationStatus.UNCHECKED:
+                self._get_unchecked_index(mission_id, mission)[note.note_id] = note
             mission.update_timestamp()
             
             # Process note for auto-created document group if enabled
@@ -896,6 +902,10 @@ class AsyncContextManager:
         mission = self.get_mission_context(mission_id)
         if mission:
             mission.notes.extend(notes)
+            unchecked_index = self._get_unchecked_index(mission_id, mission)
+            for note in notes:
+                if note.verification_status == VerificationStatus.UNCHECKED:
+                    unchecked_index[note.note_id] = note
             mission.update_timestamp()
             
             # Process notes for auto-created document group if enabled
@@ -964,13 +974,37 @@ class AsyncContextManager:
             logger.warning(f"Cannot get notes for non-existent mission ID: {mission_id}")
             return []
 
+    def _get_unchecked_index(self, mission_id: str, mission: MissionContext) -> Dict[str, Note]:
+        """Returns the note_id -> Note index of unchecked notes, rebuilding it if mission.notes was replaced."""
+        entry = self._unchecked_notes.get(mission_id)
+        if entry is None or entry[0] is not mission.notes:
+            unchecked = VerificationStatus.UNCHECKED
+            index = {note.note_id: note for note in mission.notes if note.verification_status == unchecked}
+            entry = (mission.notes, index)
+            self._unchecked_notes[mission_id] = entry
+        return entry[1]
+
+    def get_unchecked_notes(self, mission_id: str) -> List[Note]:
+        """Retrieves the notes for a mission that have not yet been verified by the critic."""
+        mission = self.get_mission_context(mission_id)
+        if mission:
+            return list(self._get_unchecked_index(mission_id, mission).values())
+        else:
+            logger.warning(f"Cannot get unchecked notes for non-existent mission ID: {mission_id}")
+            return []
+
     async def remove_notes(self, mission_id: str, note_ids_to_remove: List[str]):
         """Removes notes and persists the updated context to the database."""
         mission = self.get_mission_context(mission_id)
         if mission:
             initial_count = len(mission.notes)
             ids_to_remove_set = set(note_ids_to_remove)
+            unchecked_index = self._get_unchecked_index(mission_id, mission)
             mission.notes = [note for note in mission.notes if note.note_id not in ids_to_remove_set]
+            # Carry the index over to the new list rather than rebuilding it
+            for note_id in ids_to_remove_set:
+                unchecked_index.pop(note_id, None)
+            self._unchecked_notes[mission_id] = (mission.notes, unchecked_index)
             final_count = len(mission.notes)
             removed_count = initial_count - final_count
             
@@ -988,6 +1022,71 @@ class AsyncContextManager:
         else:
             logger.error(f"Cannot remove notes for non-existent mission ID: {mission_id}")
 
+    def _append_note_history(
+        self,
+        db: AsyncSession,
+        mission_id: str,
+        note_id: str,
+        agent_name: str,
+        record_type: str,
+        record: BaseModel
+    ) -> None:
+        """
+        Stages a note history record in the note history table.
+        Notes only keep their latest revision/critique in memory; this table is the append-only full history.
+        The record is written by the session's next commit.
+        """
+        crud.add_note_history_entry(
+            db=db,
+            mission_id=mission_id,
+            note_id=note_id,
+            agent_name=agent_name,
+            record_type=record_type,
+            record=sanitize_for_jsonb(record.model_dump(mode='json'))
+        )
+
+    async def append_critique_history(
+        self,
+        mission_id: str,
+        note_id: str,
+        critique: NotesCritiqueOutput,
+        db: Optional[AsyncSession] = None
+    ) -> None:
+        """
+        Persists a critique pass for a note to external, append-only storage.
+        With a session, the entry is committed along with the caller's next commit.
+        """
+        if db is not None:
+            self._append_note_history(db, mission_id, note_id, "NotesCriticAgent", "critique", critique)
+            return
+        async with get_async_db() as db:
+            try:
+                self._append_note_history(db, mission_id, note_id, "NotesCriticAgent", "critique", critique)
+                await db.commit()
+            except Exception as e:
+                logger.error(f"Database error appending critique history for note {note_id} in mission {mission_id}: {e}", exc_info=True)
+
+    async def append_revision_history(
+        self,
+        mission_id: str,
+        note_id: str,
+        revision: NoteRevision,
+        db: Optional[AsyncSession] = None
+    ) -> None:
+        """
+        Persists a revision of a note to external, append-only storage.
+        With a session, the entry is committed along with the caller's next commit.
+        """
+        if db is not None:
+            self._append_note_history(db, mission_id, note_id, revision.agent_name, "revision", revision)
+            return
+        async with get_async_db() as db:
+            try:
+                self._append_note_history(db, mission_id, note_id, revision.agent_name, "revision", revision)
+                await db.commit()
+            except Exception as e:
+                logger.error(f"Database error appending revision history for note {note_id} in mission {mission_id}: {e}", exc_info=True)
+
     async def revise_note(
         self, 
         mission_id: str, 
@@ -998,7 +1097,8 @@ class AsyncContextManager:
         structured_analysis: Optional[Any] = None
     ):
         """
-        Updates a note with new content and tracks the revision history.
+        Updates a note with new content, keeping the latest revision on the note and
+        appending the full revision to the history table.
         Persists the updated context to the database.
         """
         mission = self.get_mission_context(mission_id)
@@ -1010,8 +1110,9 @@ class AsyncContextManager:
         target_note = None
         for note in mission.notes:
             if note.note_id == note_id:
-                # Create revision entry
-                revision = NoteRevision(
+                # Create revision entry (all values come from the existing note and caller,
+                # so skip validation with model_construct)
+                revision = NoteRevision.model_construct(
                     agent_name=agent_name,
                     change_type="content" if not structured_analysis else "structured_analysis",
                     original_value=note.content,
@@ -1019,7 +1120,8 @@ class AsyncContextManager:
                     feedback=reason,
                     timestamp=get_current_time()
                 )
-                note.revision_history.append(revision)
+                note.latest_revision = revision
+                note.revision_count += 1
                 
                 # Update content
                 note.content = new_content
@@ -1035,6 +1137,8 @@ class AsyncContextManager:
              mission.update_timestamp()
              async with get_async_db() as db:
                 try:
+                    # Committed together with the context update below
+                    await self.append_revision_history(mission_id, note_id, target_note.latest_revision, db=db)
                     sanitized_context = sanitize_for_jsonb(mission.model_dump(mode='json'))
                     await crud.update_mission_context(db, mission_id=mission_id, mission_context=sanitized_context)
                     logger.info(f"Revised note {note_id} in mission {mission_id} by {agent_name}")
@@ -1076,7 +1180,7 @@ class AsyncContextManager:
         feedback: str, 
         critique_result: Optional[NotesCritiqueOutput] = None
     ):
-        """Updates note verification status and adds critique result."""
+        """Updates note verification status and records the critique result (latest on the note, full history in the DB)."""
         mission = self.get_mission_context(mission_id)
         if not mission:
              logger.error(f"Cannot update verification: Mission {mission_id} not found.")
@@ -1086,10 +1190,16 @@ class AsyncContextManager:
         target_note = None
         for note in mission.notes:
             if note.note_id == note_id:
+                unchecked_index = self._get_unchecked_index(mission_id, mission)
                 note.verification_status = status
                 note.verification_feedback = feedback
+                if status == VerificationStatus.UNCHECKED:
+                    unchecked_index[note_id] = note
+                else:
+                    unchecked_index.pop(note_id, None)
                 if critique_result:
-                    note.critique_results.append(critique_result)
+                    note.latest_critique = critique_result
+                    note.critique_count += 1
                 note.updated_at = get_current_time()
                 target_note = note
                 note_found = True
@@ -1099,6 +1209,9 @@ class AsyncContextManager:
              mission.update_timestamp()
              async with get_async_db() as db:
                  try:
+                    if critique_result:
+                        # Committed together with the context update below
+                        await self.append_critique_history(mission_id, note_id, critique_result, db=db)
                     sanitized_context = sanitize_for_jsonb(mission.model_dump(mode='json'))
                     await crud.update_mission_context(db, mission_id=mission_id, mission_context=sanitized_context)
                     logger.info(f"Updated verification for note {note_id} to {status}")
@@ -1951,9 +2064,9 @@ class AsyncContextManager:
                                 
                                 # Check if we have the full page text stored in metadata
                                 if isinstance(metadata, dict):
-                                    full_text = metadata.get('full_text', None)
+                                    full_text = metadata.get('full_text') or (metadata.get('extras') or {}).get('full_text')
                                 else:
-                                    full_text = getattr(metadata, 'full_text', None)
+                                    full_text = metadata.extras.get('full_text')
                                 
                                 if full_text:
                                     content = full_text
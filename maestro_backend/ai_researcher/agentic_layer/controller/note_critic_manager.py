@@ -1,12 +1,27 @@
+import asyncio
 import logging
 import queue
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from ai_researcher.agentic_layer.async_context_manager import ExecutionLogEntry
-from ai_researcher.agentic_layer.schemas.notes import Note, VerificationStatus
+from ai_researcher.agentic_layer.schemas.notes import Note, NotesCritiqueOutput, SourceAlignmentResult, VerificationStatus
+from ai_researcher.agentic_layer.utils.source_alignment import claim_coverages, missing_key_tokens, ngram_coverage, tokenize
 from ai_researcher.agentic_layer.controller.utils.status_checks import acheck_mission_status, check_mission_status_async
+from ai_researcher.dynamic_config import get_max_concurrent_requests, get_notes_critique_batch_size
 
 logger = logging.getLogger(__name__)
 
+# How often (seconds) to re-check mission status while critique tasks are in flight
+STATUS_POLL_INTERVAL = 2.0
+
+# Claims (sentences) whose word 4-grams are at least this fraction contained in the
+# source snippet are treated as supported; unsupported claims are flagged to the critic
+CLAIM_MATCH_THRESHOLD = 0.8
+
+# A note passes without an LLM critique only if every claim is supported, none of its
+# numbers or negations are missing from the snippet, and at least this fraction of its
+# word 3-grams occur in the snippet
+VERBATIM_MATCH_THRESHOLD = 0.9
+
 class NoteCriticManager:
     """
     Manages the critique and verification of research notes.
@@ -14,6 +29,52 @@ class NoteCriticManager:
     def __init__(self, controller):
         self.controller = controller
 
+    def _local_source_alignment(self, note: Note) -> Tuple[Optional[NotesCritiqueOutput], List[str]]:
+        """
+        Checks each claim in the note against its source snippet.
+        Returns a PASSED critique if the note restates the snippet, otherwise None and
+        the claims that were not found, which the LLM critique should focus on.
+        Claims too short to check, or with numbers or negations the snippet lacks, are suspect.
+        Notes with structured analysis are always sent to the LLM unflagged.
+        """
+        snippet = note.source_metadata.snippet
+        if note.structured_analysis or not snippet:
+            return None, []
+
+        coverages = claim_coverages(note.content, snippet)
+        if not coverages:
+            return None, []
+
+        missing_tokens = missing_key_tokens(note.content, snippet)
+        suspect_claims = [
+            claim for claim, coverage in coverages
+            if coverage < CLAIM_MATCH_THRESHOLD or not missing_tokens.isdisjoint(tokenize(claim))
+        ]
+        if suspect_claims:
+            return None, suspect_claims
+
+        coverage = ngram_coverage(note.content, snippet)
+        if coverage < VERBATIM_MATCH_THRESHOLD:
+            return None, []
+
+        # Built locally from trusted values, so skip validation
+        return NotesCritiqueOutput.model_construct(
+            note_id=note.note_id,
+            overall_assessment=f"All {len(coverages)} claims match the source snippet ({coverage:.0%} word overlap); verified locally.",
+            accuracy_score=coverage,
+            source_alignment=SourceAlignmentResult.model_construct(
+                aligned=True,
+                coverage_percentage=coverage,
+                unsupported_claims=[]
+            ),
+            hallucinations_detected=[],
+            suggested_refinements=[],
+            revise_needed=False,
+            verification_status=VerificationStatus.PASSED,
+            scratchpad_update="",
+            generated_thought=None
+        ), []
+
     @acheck_mission_status
     async def critique_all_notes(
         self,
@@ -23,6 +84,8 @@ class NoteCriticManager:
     ):
         """
         Runs the NoteCriticAgent on all unchecked notes for the mission.
+        Batches are critiqued by concurrent workers while a consumer writes the results;
+        the scratchpad is flushed once after all batches finish.
         """
         mission_context = self.controller.context_manager.get_mission_context(mission_id)
         if not mission_context:
@@ -33,49 +96,181 @@ class NoteCriticManager:
         active_thoughts = self.controller.context_manager.get_recent_thoughts(mission_id)
         scratchpad = self.controller.context_manager.get_scratchpad(mission_id)
 
-        notes_to_critique = [
-            n for n in mission_context.notes 
-            if n.verification_status == VerificationStatus.UNCHECKED
-        ]
-        
+        notes_to_critique = self.controller.context_manager.get_unchecked_notes(mission_id)
+
         logger.info(f"Starting critique for {len(notes_to_critique)} notes in mission {mission_id}")
 
-        processed_count = 0
+        # Short-circuit notes whose claims all appear in their source snippet
+        local_critiques: List[NotesCritiqueOutput] = []
+        notes_for_llm: List[Note] = []
+        suspect_claims: Dict[str, List[str]] = {}
         for note in notes_to_critique:
-             # Check status per note
-             if not await check_mission_status_async(self.controller, mission_id):
-                 logger.info(f"Mission {mission_id} stopped during critique.")
-                 break
-
-             # Infer section goal (fallback to user request if no specific assignment)
-             section_goal = mission_context.user_request
-             # Optional: Look up potential sections in plan to get better goal
-             
-             critique_output, _, scratchpad_update = await self.controller.notes_critic_agent.run(
-                 note=note,
-                 section_goal=section_goal,
-                 active_goals=active_goals,
-                 active_thoughts=active_thoughts,
-                 agent_scratchpad=scratchpad,
-                 mission_id=mission_id,
-                 log_queue=log_queue,
-                 update_callback=update_callback
-             )
-             
-             if critique_output:
-                 await self.controller.context_manager.update_note_verification(
-                     mission_id=mission_id,
-                     note_id=note.note_id,
-                     status=critique_output.verification_status,
-                     feedback=critique_output.overall_assessment,
-                     critique_result=critique_output
-                 )
-                 
-                 if scratchpad_update:
-                      await self.controller.context_manager.update_scratchpad(mission_id, scratchpad_update)
-                      scratchpad = scratchpad_update # Update local ref
-                 
-                 processed_count += 1
+            local_critique, note_suspect_claims = self._local_source_alignment(note)
+            if local_critique is None:
+                notes_for_llm.append(note)
+                if note_suspect_claims:
+                    suspect_claims[note.note_id] = note_suspect_claims
+            else:
+                local_critiques.append(local_critique)
+
+        if local_critiques:
+            logger.info(f"Verified {len(local_critiques)} notes locally against their source snippets; {len(notes_for_llm)} need LLM critique.")
+
+        # Infer section goal (fallback to user request if no specific assignment)
+        section_goal = mission_context.user_request
+        # Optional: Look up potential sections in plan to get better goal
+
+        # Goals and thoughts are the same for every note, so format them once
+        critic_agent = self.controller.notes_critic_agent
+        goals_str = critic_agent.format_goals(active_goals)
+        thoughts_str = critic_agent.format_thoughts(active_thoughts)
+
+        batch_size = max(1, get_notes_critique_batch_size(mission_id))
+        batches = [
+            notes_for_llm[i:i + batch_size]
+            for i in range(0, len(notes_for_llm), batch_size)
+        ]
+
+        async def critique_batch(batch: List[Note]) -> Tuple[List[NotesCritiqueOutput], List[str]]:
+            critiques: List[NotesCritiqueOutput] = []
+            scratchpad_updates: List[str] = []
+
+            # Apply both mission-specific and controller semaphores
+            mission_semaphore = self.controller.context_manager.get_mission_semaphore(mission_id)
+            async with mission_semaphore:
+                async with self.controller.maybe_semaphore:
+                    if len(batch) > 1:
+                        critiques, _, scratchpad_update, notes_to_retry = await critic_agent.run_batch(
+                            notes=batch,
+                            section_goal=section_goal,
+                            active_goals=active_goals,
+                            active_thoughts=active_thoughts,
+                            agent_scratchpad=scratchpad,
+                            mission_id=mission_id,
+                            log_queue=log_queue,
+                            update_callback=update_callback,
+                            goals_str=goals_str,
+                            thoughts_str=thoughts_str,
+                            suspect_claims=suspect_claims
+                        )
+                        if scratchpad_update:
+                            scratchpad_updates.append(scratchpad_update)
+                        # Only notes a parsed batch response left out are retried one by one. If the
+                        # request itself failed, per-note retries would multiply the load on a provider
+                        # that is likely rate-limiting; those notes stay unchecked for the next run.
+                        skipped_count = len(batch) - len(critiques) - len(notes_to_retry)
+                        if skipped_count:
+                            logger.warning(f"Batch critique request failed for {skipped_count} notes in mission {mission_id}; leaving them unchecked.")
+                    else:
+                        notes_to_retry = batch
+
+                    for note in notes_to_retry:
+                        critique_output, _, scratchpad_update = await critic_agent.run(
+                            note=note,
+                            section_goal=section_goal,
+                            active_goals=active_goals,
+                            active_thoughts=active_thoughts,
+                            agent_scratchpad=scratchpad,
+                            mission_id=mission_id,
+                            log_queue=log_queue,
+                            update_callback=update_callback,
+                            goals_str=goals_str,
+                            thoughts_str=thoughts_str,
+                            suspect_claims=suspect_claims.get(note.note_id)
+                        )
+                        if critique_output:
+                            critiques.append(critique_output)
+                            if scratchpad_update:
+                                scratchpad_updates.append(scratchpad_update)
+
+            return critiques, scratchpad_updates
+
+        # Pipeline: LLM workers pull batches and push results; a single consumer writes the
+        # verifications, so context-manager I/O overlaps the next LLM calls instead of
+        # serializing behind them. Workers match the per-mission semaphore's share of the
+        # concurrency limit, and the result queue is bounded by the worker count.
+        worker_count = max(1, min(len(batches), get_max_concurrent_requests(mission_id) // 2))
+        batch_queue: asyncio.Queue = asyncio.Queue()
+        for batch_index, batch in enumerate(batches):
+            batch_queue.put_nowait((batch_index, batch))
+        result_queue: asyncio.Queue = asyncio.Queue(maxsize=worker_count)
+
+        async def critique_worker() -> None:
+            while True:
+                try:
+                    batch_index, batch = batch_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    critiques, scratchpad_updates = await critique_batch(batch)
+                except Exception as e:
+                    logger.error(f"Note critique batch failed for mission {mission_id}: {e}", exc_info=True)
+                    continue
+                await result_queue.put((batch_index, critiques, scratchpad_updates))
+
+        async def verification_consumer() -> Tuple[int, Optional[str]]:
+            processed_count = 0
+            # Each scratchpad update replaces the previous one, so only the last in batch
+            # order matters. Buffer it and flush once instead of writing the context per update.
+            final_scratchpad: Optional[Tuple[int, str]] = None
+            while True:
+                item = await result_queue.get()
+                if item is None:
+                    break
+                batch_index, critiques, scratchpad_updates = item
+                for critique_output in critiques:
+                    await self.controller.context_manager.update_note_verification(
+                        mission_id=mission_id,
+                        note_id=critique_output.note_id,
+                        status=critique_output.verification_status,
+                        feedback=critique_output.overall_assessment,
+                        critique_result=critique_output
+                    )
+                    processed_count += 1
+                if scratchpad_updates and (final_scratchpad is None or batch_index > final_scratchpad[0]):
+                    final_scratchpad = (batch_index, scratchpad_updates[-1])
+            return processed_count, final_scratchpad[1] if final_scratchpad else None
+
+        def register_subtask(task: asyncio.Task) -> None:
+            # Register subtask with controller for cancellation tracking
+            self.controller.add_mission_subtask(mission_id, task)
+            task.add_done_callback(lambda t: self.controller.remove_mission_subtask(mission_id, t))
+
+        consumer = asyncio.create_task(verification_consumer())
+        register_subtask(consumer)
+        workers: List[asyncio.Task] = []
+        for _ in range(worker_count if batches else 0):
+            worker = asyncio.create_task(critique_worker())
+            register_subtask(worker)
+            workers.append(worker)
+
+        # Locally verified notes are written while the first LLM batches are in flight
+        if local_critiques:
+            await result_queue.put((-1, local_critiques, []))
+
+        pending = set(workers)
+        while pending:
+            _, pending = await asyncio.wait(pending, timeout=STATUS_POLL_INTERVAL, return_when=asyncio.FIRST_COMPLETED)
+
+            if pending and (consumer.done() or not await check_mission_status_async(self.controller, mission_id)):
+                logger.info(f"Mission {mission_id} stopped during critique. Cancelling {len(pending)} critique workers.")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                break
+
+        # Let the consumer drain results already produced, then stop it
+        processed_count, final_scratchpad = 0, None
+        if not consumer.done():
+            await result_queue.put(None)
+        consumer_result = (await asyncio.gather(consumer, return_exceptions=True))[0]
+        if isinstance(consumer_result, BaseException):
+            logger.error(f"Note verification consumer failed for mission {mission_id}: {consumer_result}")
+        else:
+            processed_count, final_scratchpad = consumer_result
+
+        if final_scratchpad:
+            await self.controller.context_manager.update_scratchpad(mission_id, final_scratchpad)
 
         await self.controller.context_manager.log_execution_step(
             mission_id, "NoteCriticManager", "Batch Critique",
@@ -459,7 +459,7 @@ CRITICAL: Do NOT include formatting like "**Title:**", "Title:", markdown, or an
                                 title = metadata_dict.get('title') or metadata_dict.get('original_filename', f'Document {doc_id}')
                                 year = metadata_dict.get('publication_year') or metadata_dict.get('year')
                                 authors = metadata_dict.get('authors')
-                                journal = metadata_dict.get('journal_or_source')
+                                journal = metadata_dict.get('extras', {}).get('journal_or_source')
                                 
                                 # Remove file extension from title if it's a filename
                                 if title and title.endswith('.pdf'):
@@ -540,7 +540,7 @@ CRITICAL: Do NOT include formatting like "**Title:**", "Title:", markdown, or an
                         web_title = metadata_dict.get('title', 'Unknown Title')
                         web_year = metadata_dict.get('publication_year')  # Get raw value or None
                         web_authors = metadata_dict.get('authors')  # Get raw value or None
-                        web_source_name = metadata_dict.get('journal_or_source')  # e.g., website name
+                        web_source_name = metadata_dict.get('extras', {}).get('journal_or_source')  # e.g., website name
 
                         # Process authors (similar to document handling)
                         web_authors_str = None
@@ -15,9 +15,19 @@ from ai_researcher.dynamic_config import get_model_name
 from ai_researcher.user_context import get_user_settings
 from ai_researcher.global_semaphore import get_global_llm_semaphore
 
+# HTTP/2 support in httpx needs the optional h2 package
+try:
+    import h2
+except ImportError:
+    h2 = None
+
 # Configure logging - respect LOG_LEVEL environment variable
 logger = logging.getLogger(__name__)
 
+# Idle connections kept open in the dispatcher's shared pool, so repeated small
+# LLM requests reuse an established TLS connection instead of re-handshaking
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 64
+
 class ModelDispatcher:
     """
     Handles interactions with configured LLM APIs (OpenRouter and/or Local) asynchronously.
@@ -28,6 +38,10 @@ class ModelDispatcher:
         self.max_retries = config.MAX_RETRIES
         self.retry_delay = config.RETRY_DELAY
         self.clients: Dict[str, Optional[AsyncOpenAI]] = {}
+        # (base_url, api_key) each cached client was built with, to detect credential changes
+        self._client_credentials: Dict[str, Tuple[str, str]] = {}
+        # One connection pool shared by every provider client of this dispatcher
+        self.http_client: Optional[httpx.AsyncClient] = None
         self.semaphore = semaphore
         self.context_manager = context_manager
         self.model_pricing_cache: Dict[str, Dict[str, Decimal]] = {}
@@ -80,12 +94,7 @@ class ModelDispatcher:
                 continue
 
             try:
-                client = AsyncOpenAI(
-                    base_url=base_url,
-                    api_key=api_key,
-                    timeout=config.LLM_REQUEST_TIMEOUT
-                )
-                self.clients[provider_name] = client
+                client = self._create_async_client(provider_name, base_url, api_key)
                 logger.info(f"AsyncOpenAI client initialized successfully for provider: {provider_name} at {base_url}")
             except Exception as e:
                 logger.error(f"Error initializing AsyncOpenAI client for provider {provider_name}: {e}", exc_info=True)
@@ -148,18 +157,43 @@ class ModelDispatcher:
         
         return config_data if config_data else None
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Returns the shared pooled HTTP client, creating it if needed (or after cleanup)."""
+        if self.http_client is None or self.http_client.is_closed:
+            # The SDK's client keeps its redirect handling and timeouts; only keep-alive differs from its limits
+            self.http_client = openai.DefaultAsyncHttpxClient(
+                http2=h2 is not None,
+                limits=httpx.Limits(
+                    max_connections=1000,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=5.0
+                )
+            )
+        return self.http_client
+
+    def _create_async_client(self, provider_name: str, base_url: str, api_key: str) -> AsyncOpenAI:
+        """Creates an AsyncOpenAI client on the shared connection pool and caches it for the provider."""
+        client = AsyncOpenAI(
+            base_url=base_url,
+            api_key=api_key,
+            timeout=config.LLM_REQUEST_TIMEOUT,
+            http_client=self._get_http_client()
+        )
+        self.clients[provider_name] = client
+        self._client_credentials[provider_name] = (base_url, api_key)
+        return client
+
     async def cleanup(self):
-        """Cleanup method to properly close all AsyncOpenAI clients."""
-        for provider_name, client in self.clients.items():
-            if client is not None:
-                try:
-                    # AsyncOpenAI clients have an httpx AsyncClient that needs to be closed
-                    if hasattr(client, '_client'):
-                        await client._client.aclose()
-                    logger.debug(f"Closed AsyncOpenAI client for provider: {provider_name}")
-                except Exception as e:
-                    logger.warning(f"Error closing AsyncOpenAI client for provider {provider_name}: {e}")
+        """Cleanup method to close the shared connection pool used by all AsyncOpenAI clients."""
+        if self.http_client is not None:
+            try:
+                await self.http_client.aclose()
+                logger.debug(f"Closed shared HTTP client for providers: {list(self.clients.keys())}")
+            except Exception as e:
+                logger.warning(f"Error closing shared HTTP client: {e}")
+            self.http_client = None
         self.clients.clear()
+        self._client_credentials.clear()
 
     def _get_or_create_client(self, provider_name: str, current_user_settings: Optional[Dict[str, Any]]) -> Optional[AsyncOpenAI]:
         """
@@ -191,21 +225,21 @@ class ModelDispatcher:
             logger.error(f"Missing credentials for provider '{provider_name}': API key {'missing' if not api_key else 'present'}, Base URL {'missing' if not base_url else 'present'}")
             return None
         
-        # Check if we have an existing client and if its credentials match
+        # Reuse the existing client while its credentials match and its pool is still open
         existing_client = self.clients.get(provider_name)
+        if (
+            existing_client is not None
+            and self._client_credentials.get(provider_name) == (base_url, api_key)
+            and self.http_client is not None
+            and not self.http_client.is_closed
+        ):
+            return existing_client
         if existing_client:
-            # For now, always create a fresh client to ensure we use the latest credentials
-            # In the future, we could compare credentials to avoid unnecessary recreation
             logger.info(f"[DEBUG] Creating fresh client for {provider_name} with updated credentials")
         
         try:
-            client = AsyncOpenAI(
-                base_url=base_url,
-                api_key=api_key,
-                timeout=config.LLM_REQUEST_TIMEOUT
-            )
-            # Update the cached client
-            self.clients[provider_name] = client
+            # Update the cached client; it shares the dispatcher's connection pool
+            client = self._create_async_client(provider_name, base_url, api_key)
             logger.info(f"[DEBUG] Fresh AsyncOpenAI client created successfully for provider: {provider_name} at {base_url}")
             return client
         except Exception as e:
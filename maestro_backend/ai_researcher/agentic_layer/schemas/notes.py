@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, model_validator
 from typing import List, Dict, Any, Literal, ClassVar, Optional
 from datetime import datetime
 from enum import Enum
@@ -36,8 +36,31 @@ class SourceMetadata(BaseModel):
     abstract: Optional[str] = Field(None, description="Abstract from the source")
     publication_year: Optional[int] = Field(None, description="Publication year as integer")
     doc_id: Optional[str] = Field(None, description="Document ID")
-    
-    model_config: ClassVar[ConfigDict] = ConfigDict(extra='allow')
+
+    # Lineage of internal (synthesized) notes
+    synthesized_from_notes: Optional[List[str]] = Field(None, description="IDs of the notes an internal note was synthesized from")
+    aggregated_original_sources: Optional[List[Dict[str, Any]]] = Field(None, description="Original document/web sources traced through the synthesis chain")
+
+    # Source-specific keys without a dedicated field (e.g. fetcher metadata)
+    extras: Dict[str, Any] = Field(default_factory=dict, description="Additional source metadata")
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(extra='forbid')
+
+    @model_validator(mode='before')
+    @classmethod
+    def _collect_extras(cls, data: Any) -> Any:
+        """Moves keys without a declared field (including flat keys in older stored notes) into `extras`."""
+        if not isinstance(data, dict):
+            return data
+        unknown_keys = data.keys() - cls.model_fields.keys()
+        if not unknown_keys:
+            return data
+        data = dict(data)
+        extras = dict(data.get("extras") or {})
+        for key in unknown_keys:
+            extras[key] = data.pop(key)
+        data["extras"] = extras
+        return data
 
 # --- STRUCTURED ANALYSIS ---
 class NoteAnalysis(BaseModel):
@@ -85,6 +108,10 @@ class NotesCritiqueOutput(BaseModel):
     scratchpad_update: str = Field(..., description="Update for the agent scratchpad.")
     generated_thought: Optional[str] = Field(None, description="Internal thought to be added to the thought pad.")
 
+class NotesCritiqueBatchOutput(BaseModel):
+    """Structured output from the NotesCriticAgent when critiquing several notes in one request."""
+    critiques: List[NotesCritiqueOutput] = Field(..., description="One critique per note, matched by note_id.")
+
 class NoteRevision(BaseModel):
     """Track modifications to a note."""
     timestamp: datetime = Field(default_factory=datetime.now, description="When the revision occurred.")
@@ -124,11 +151,40 @@ class Note(BaseModel):
     
     # 6. TIMESTAMPS
     created_at: datetime = Field(default_factory=datetime.now, description="Timestamp of creation.")
-    updated_at: datetime = Field(default_factory=datetime.now, description="Timestamp of last update.")
+    updated_at: Optional[datetime] = Field(None, description="Timestamp of last update (defaults to created_at).")
     is_relevant: bool = Field(default=True, description="Flag indicating relevance.")
     
-    # 7. HISTORY & AUDIT
-    revision_history: List[NoteRevision] = Field(default_factory=list, description="Track all modifications to this note")
-    critique_results: List[NotesCritiqueOutput] = Field(default_factory=list, description="History of all critique passes")
+    # 7. HISTORY & AUDIT (only the latest entries are kept; full history is appended to the mission note history table)
+    latest_revision: Optional[NoteRevision] = Field(None, description="Most recent modification to this note")
+    revision_count: int = Field(default=0, description="Number of modifications made to this note")
+    latest_critique: Optional[NotesCritiqueOutput] = Field(None, description="Most recent critique pass")
+    critique_count: int = Field(default=0, description="Number of critique passes")
+
+    model_config: ClassVar[ConfigDict] = ConfigDict(extra='forbid')
+
+    @model_validator(mode='before')
+    @classmethod
+    def _fold_legacy_history(cls, data: Any) -> Any:
+        """Converts the old revision_history/critique_results lists into latest entries and counts."""
+        if not isinstance(data, dict) or ("revision_history" not in data and "critique_results" not in data):
+            return data
+        data = dict(data)
+        for list_key, latest_key, count_key in (
+            ("revision_history", "latest_revision", "revision_count"),
+            ("critique_results", "latest_critique", "critique_count"),
+        ):
+            history = data.pop(list_key, None) or []
+            if history:
+                data.setdefault(latest_key, history[-1])
+                data.setdefault(count_key, len(history))
+        return data
+
+    def model_post_init(self, __context: Any) -> None:
+        # Reuse the creation timestamp rather than reading the clock a second time
+        if self.updated_at is None:
+            self.updated_at = self.created_at
 
-    model_config: ClassVar[ConfigDict] = ConfigDict(extra='forbid')
\ No newline at end of file
+# --- SHARED VALIDATORS ---
+# Adapters for validating untrusted LLM output, shared by the agents that produce notes and critiques.
+NOTE_ADAPTER: TypeAdapter[Note] = TypeAdapter(Note)
+NOTES_CRITIQUE_ADAPTER: TypeAdapter[NotesCritiqueOutput] = TypeAdapter(NotesCritiqueOutput)
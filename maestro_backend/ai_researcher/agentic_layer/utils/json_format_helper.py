@@ -14,7 +14,8 @@ logger = logging.getLogger(__name__)
 
 def get_json_schema_format(
     pydantic_model: type[BaseModel],
-    schema_name: str = "response"
+    schema_name: str = "response",
+    strict: bool = True
 ) -> Dict[str, Any]:
     """
     Get json_schema format configuration (OpenAI structured outputs).
@@ -22,6 +23,8 @@ def get_json_schema_format(
     Args:
         pydantic_model: The Pydantic model class defining the schema
         schema_name: A descriptive name for the schema
+        strict: Whether to request strict validation (requires every field to be
+            required and additionalProperties to be false)
         
     Returns:
         Dictionary with json_schema format configuration
@@ -31,7 +34,7 @@ def get_json_schema_format(
         "json_schema": {
             "name": schema_name,
             "schema": pydantic_model.model_json_schema(),
-            "strict": True  # Enable strict validation
+            "strict": strict
         }
     }
 
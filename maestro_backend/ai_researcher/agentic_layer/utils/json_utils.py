@@ -13,6 +13,12 @@ import re
 import logging
 from typing import Any, Dict, List, Tuple, Type, TypeVar, Optional, Union
 
+# orjson is much faster than the stdlib parser for multi-KB LLM responses; fall back if unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
@@ -72,6 +78,27 @@ def parse_json_string_recursively(data: Any) -> Any:
         # For other types (int, float, bool, None), return as is
         return data
 
+def fast_json_loads(raw_json: str) -> Any:
+    """
+    Parse a JSON string with orjson when available, falling back to the stdlib parser.
+    
+    orjson is stricter than json.loads (e.g. it rejects NaN/Infinity and integers
+    beyond 64 bits), so any orjson failure is retried with json.loads. Errors are
+    therefore always raised as json.JSONDecodeError.
+    
+    Args:
+        raw_json: The JSON string to parse.
+        
+    Returns:
+        The parsed Python object.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw_json)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw_json)
+
 def extract_json_from_thinking_model_response(raw_response: str) -> str:
     """
     Extract JSON from responses that may contain thinking tokens or reasoning text.
@@ -189,7 +216,7 @@ def parse_llm_json_response(raw_json: str) -> Dict[str, Any]:
     sanitized_json = sanitize_json_string(raw_json)
     
     try:
-        parsed_data = json.loads(sanitized_json)
+        parsed_data = fast_json_loads(sanitized_json)
     except json.JSONDecodeError as e:
         logger.warning(f"Initial JSON parsing failed: {e}. Attempting to fix common issues...")
         try:
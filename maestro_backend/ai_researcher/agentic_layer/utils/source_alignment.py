@@ -0,0 +1,146 @@
+"""
+Cheap, local checks of how closely a note's text follows its source snippet.
+
+These run before the NotesCriticAgent so that notes which simply restate their
+source can be verified without an LLM round-trip, and so that the LLM critique
+of the remaining notes can focus on the claims not found in the source. Matching is done on lowercase
+word n-grams, which is linear in the length of the texts and tolerant of
+whitespace, punctuation and casing differences.
+"""
+
+import re
+from typing import List, Optional, Set, Tuple
+
+_WORD_RE = re.compile(r"\w+")
+# Sentence boundaries: terminal punctuation followed by whitespace, or line breaks
+_CLAIM_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+
+# Default n-gram size for coverage checks; 3-word shingles are specific enough to
+# distinguish copied phrasing from shared vocabulary.
+DEFAULT_NGRAM_SIZE = 3
+
+# N-gram size for claim-level checks; individual sentences need longer shingles
+# before a match is evidence the claim was taken from the source.
+CLAIM_NGRAM_SIZE = 4
+
+# Tokens that flip a claim's meaning while barely moving its n-gram overlap. Contractions
+# such as "isn't" tokenize to "isn" + "t", so the trailing "t" stands in for them.
+NEGATION_TOKENS = frozenset({
+    "no", "not", "never", "none", "nor", "neither", "nothing", "nobody", "without", "cannot", "t"
+})
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text: The text to tokenize.
+
+    Returns:
+        A list of word tokens (empty if text is None or blank).
+    """
+    if not text:
+        return []
+    return _WORD_RE.findall(text.lower())
+
+
+def build_ngram_set(tokens: List[str], n: int = DEFAULT_NGRAM_SIZE) -> Set[Tuple[str, ...]]:
+    """
+    Build the set of word n-grams for a token list.
+
+    Args:
+        tokens: The word tokens.
+        n: The n-gram size.
+
+    Returns:
+        A set of n-gram tuples (empty if there are fewer than n tokens).
+    """
+    return {tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1)}
+
+
+def ngram_coverage(text: Optional[str], source: Optional[str], n: int = DEFAULT_NGRAM_SIZE) -> float:
+    """
+    Compute the fraction of the text's word n-grams that also occur in the source.
+
+    Args:
+        text: The text being checked (e.g. note content).
+        source: The reference text (e.g. the note's source snippet).
+        n: The n-gram size.
+
+    Returns:
+        Coverage between 0.0 and 1.0. Texts shorter than n words return 0.0,
+        since there is not enough signal to call them supported.
+    """
+    text_ngrams = build_ngram_set(tokenize(text), n)
+    if not text_ngrams:
+        return 0.0
+    source_ngrams = build_ngram_set(tokenize(source), n)
+    if not source_ngrams:
+        return 0.0
+    return len(text_ngrams & source_ngrams) / len(text_ngrams)
+
+
+def split_claims(text: Optional[str]) -> List[str]:
+    """
+    Split text into claim sentences.
+
+    Args:
+        text: The text to split (e.g. note content).
+
+    Returns:
+        A list of non-empty, stripped sentences.
+    """
+    if not text:
+        return []
+    return [claim.strip() for claim in _CLAIM_SPLIT_RE.split(text) if claim.strip()]
+
+
+def claim_coverages(text: Optional[str], source: Optional[str], n: int = CLAIM_NGRAM_SIZE) -> List[Tuple[str, float]]:
+    """
+    Compute n-gram coverage against the source for each claim sentence in the text.
+
+    The source n-gram set is built once and shared by all claims. Claims shorter
+    than n words carry too little signal to check, so they get 0.0 coverage and
+    are reported as unsupported rather than dropped.
+
+    Args:
+        text: The text whose claims are checked (e.g. note content).
+        source: The reference text (e.g. the note's source snippet).
+        n: The n-gram size.
+
+    Returns:
+        A list of (claim, coverage) pairs in the order the claims appear.
+    """
+    source_ngrams = build_ngram_set(tokenize(source), n)
+    coverages: List[Tuple[str, float]] = []
+    for claim in split_claims(text):
+        claim_ngrams = build_ngram_set(tokenize(claim), n)
+        if not claim_ngrams:
+            coverages.append((claim, 0.0))
+            continue
+        coverages.append((claim, len(claim_ngrams & source_ngrams) / len(claim_ngrams)))
+    return coverages
+
+
+def missing_key_tokens(text: Optional[str], source: Optional[str]) -> Set[str]:
+    """
+    Find the numeric and negation tokens in the text that never occur in the source.
+
+    A changed figure ("40 percent" -> "90 percent") or an added "not" alters a single
+    token, which n-gram coverage alone scores as a near match.
+
+    Args:
+        text: The text being checked (e.g. note content).
+        source: The reference text (e.g. the note's source snippet).
+
+    Returns:
+        The set of key tokens present in the text but absent from the source.
+    """
+    key_tokens = {
+        token for token in tokenize(text)
+        if token in NEGATION_TOKENS or any(char.isdigit() for char in token)
+    }
+    if not key_tokens:
+        return set()
+    return key_tokens - set(tokenize(source))
@@ -81,6 +81,14 @@ def get_max_suggestions_per_batch(mission_id: Optional[str] = None) -> int:
     """
     return get_setting_with_fallback("max_suggestions_per_batch", 3, int, mission_id)
 
+def get_notes_critique_batch_size(mission_id: Optional[str] = None) -> int:
+    """
+    Get the number of notes to critique in a single LLM request.
+    Values of 1 or less critique each note with its own request.
+    Default: 5 notes per batch.
+    """
+    return get_setting_with_fallback("notes_critique_batch_size", 5, int, mission_id)
+
 # TODO: Add a new function to get the default note_level for "Progressive Summarization".
 # def get_default_note_level(mission_id: Optional[str] = None) -> str:
 #     return get_setting_with_fallback("default_note_level", "literature", str, mission_id)
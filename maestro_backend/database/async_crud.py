@@ -194,6 +194,30 @@ async def create_execution_log(
     await db.refresh(db_log)
     return db_log
 
+def add_note_history_entry(
+    db: AsyncSession,
+    mission_id: str,
+    note_id: str,
+    agent_name: str,
+    record_type: str,
+    record: Dict[str, Any]
+) -> models.MissionNoteHistory:
+    """
+    Stage a note history entry (critique or revision) in the session without committing,
+    so it is written in the same transaction as the caller's next commit.
+    """
+    db_entry = models.MissionNoteHistory(
+        id=str(uuid.uuid4()),
+        mission_id=mission_id,
+        note_id=note_id,
+        agent_name=agent_name,
+        record_type=record_type,
+        record=record,
+        created_at=get_current_time()
+    )
+    db.add(db_entry)
+    return db_entry
+
 async def get_mission_execution_logs(
     db: AsyncSession,
     mission_id: str,
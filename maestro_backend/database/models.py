@@ -137,6 +137,30 @@ class MissionExecutionLog(Base):
     # Relationships
     mission = relationship("Mission", back_populates="execution_logs")
 
+class MissionNoteHistory(Base):
+    """
+    Append-only history of note critiques and revisions for a mission.
+    Notes in the mission context only keep their latest critique/revision; every pass is recorded here.
+    Kept apart from mission_execution_logs so it does not crowd the user-facing log or its stats.
+    """
+    __tablename__ = "mission_note_history"
+
+    id = Column(StringUUID, primary_key=True, default=uuid.uuid4, index=True)
+    mission_id = Column(StringUUID, ForeignKey("missions.id", ondelete="CASCADE"), nullable=False, index=True)
+    note_id = Column(String, nullable=False, index=True)
+    agent_name = Column(String, nullable=False)
+    record_type = Column(String, nullable=False)  # critique, revision
+    record = Column(JSONB, nullable=False)  # Serialized NotesCritiqueOutput or NoteRevision
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+    # Relationships
+    mission = relationship("Mission", backref=backref("note_history", cascade="all, delete-orphan", passive_deletes=True))
+
+    __table_args__ = (
+        # Index for reading one note's history in order
+        sqlalchemy.Index('idx_mission_note_history_note', 'mission_id', 'note_id', 'created_at'),
+    )
+
 class Document(Base):
     """
     Document model represents uploaded documents in the system.
@@ -0,0 +1,34 @@
+-- Add an append-only table for note critique and revision history
+-- This migration is idempotent and can be run multiple times safely
+
+DO $$
+BEGIN
+    -- Create mission_note_history table; notes in the mission context keep only their latest entries
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.tables 
+        WHERE table_name = 'mission_note_history'
+    ) THEN
+        CREATE TABLE mission_note_history (
+            id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+            mission_id UUID NOT NULL REFERENCES missions(id) ON DELETE CASCADE,
+            note_id VARCHAR NOT NULL,
+            agent_name VARCHAR NOT NULL,
+            record_type VARCHAR NOT NULL, -- critique, revision
+            record JSONB NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL
+        );
+        
+        -- Create indexes for performance
+        CREATE INDEX idx_mission_note_history_mission_id ON mission_note_history(mission_id);
+        CREATE INDEX idx_mission_note_history_note_id ON mission_note_history(note_id);
+        CREATE INDEX idx_mission_note_history_note ON mission_note_history(mission_id, note_id, created_at);
+        
+        RAISE NOTICE 'Created mission_note_history table for note critique and revision history';
+    ELSE
+        RAISE NOTICE 'mission_note_history table already exists - skipping';
+    END IF;
+
+EXCEPTION
+    WHEN OTHERS THEN
+        RAISE WARNING 'Migration error: %', SQLERRM;
+END $$;
@@ -0,0 +1,228 @@
+import json
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+# Use absolute imports relative to the project root
+from ai_researcher.agentic_layer.agents import notes_critic_agent
+from ai_researcher.agentic_layer.agents.notes_critic_agent import NotesCriticAgent
+from ai_researcher.agentic_layer.schemas.notes import NoteAnalysis, NotesCritiqueOutput, VerificationStatus
+from tests.agentic_layer.note_factories import make_note
+
+def critique_dict(note_id: str, status: str = "passed") -> dict:
+    return {
+        "note_id": note_id,
+        "overall_assessment": f"Assessment of {note_id}",
+        "accuracy_score": 0.9,
+        "source_alignment": {"aligned": True, "coverage_percentage": 0.9, "unsupported_claims": []},
+        "hallucinations_detected": [],
+        "suggested_refinements": [],
+        "revise_needed": status == "revise",
+        "verification_status": status,
+        "scratchpad_update": f"Checked {note_id}",
+    }
+
+def llm_response(payload) -> MagicMock:
+    """Builds a ChatCompletion-like mock whose first choice carries the JSON payload."""
+    response = MagicMock()
+    response.choices[0].message.content = json.dumps(payload)
+    return response
+
+@pytest.fixture
+def critic_agent():
+    agent = NotesCriticAgent(model_dispatcher=MagicMock())
+    # Mock the async _call_llm method used internally for critiques
+    agent._call_llm = AsyncMock()
+    return agent
+
+# --- Tests for run_batch ---
+
+@pytest.mark.asyncio
+async def test_run_batch_maps_critiques_by_note_id(critic_agent):
+    """Critiques are matched to notes by note_id regardless of response order."""
+    notes = [make_note("note_a"), make_note("note_b", "Sleep loss hurts recall.")]
+    critic_agent._call_llm.return_value = (
+        llm_response({"critiques": [critique_dict("note_b", "revise"), critique_dict("note_a")]}),
+        {"model_name": "mock"}
+    )
+
+    critiques, details, scratchpad_update, missed_notes = await critic_agent.run_batch(notes, "Section goal")
+
+    statuses = {c.note_id: c.verification_status for c in critiques}
+    assert statuses == {"note_a": VerificationStatus.PASSED, "note_b": VerificationStatus.REVISE}
+    assert details == {"model_name": "mock"}
+    assert scratchpad_update == "Checked note_a"
+    assert missed_notes == []
+    critic_agent._call_llm.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_run_batch_ignores_duplicate_and_unknown_ids(critic_agent):
+    """Only the first critique per requested note counts; unknown ids are dropped and omitted notes are returned for retry."""
+    notes = [make_note("note_a"), make_note("note_b", "Sleep loss hurts recall.")]
+    critic_agent._call_llm.return_value = (
+        llm_response({"critiques": [
+            critique_dict("note_a"),
+            critique_dict("note_a", "revise"),
+            critique_dict("note_unknown"),
+        ]}),
+        {}
+    )
+
+    critiques, _, _, missed_notes = await critic_agent.run_batch(notes, "Section goal")
+
+    assert [(c.note_id, c.verification_status) for c in critiques] == [("note_a", VerificationStatus.PASSED)]
+    assert [note.note_id for note in missed_notes] == ["note_b"]
+
+@pytest.mark.asyncio
+async def test_run_batch_accepts_bare_list(critic_agent):
+    """A bare list of critiques is accepted in place of the {"critiques": [...]} wrapper."""
+    notes = [make_note("note_a"), make_note("note_b", "Sleep loss hurts recall.")]
+    critic_agent._call_llm.return_value = (
+        llm_response([critique_dict("note_a"), critique_dict("note_b")]),
+        {}
+    )
+
+    critiques, _, _, missed_notes = await critic_agent.run_batch(notes, "Section goal")
+
+    assert sorted(c.note_id for c in critiques) == ["note_a", "note_b"]
+    assert missed_notes == []
+
+@pytest.mark.asyncio
+async def test_run_batch_partial_validation_failure(critic_agent):
+    """A critique that fails validation is dropped and its note returned for retry, without losing the valid ones."""
+    notes = [make_note("note_a"), make_note("note_b", "Sleep loss hurts recall.")]
+    invalid = critique_dict("note_b")
+    del invalid["source_alignment"]
+    critic_agent._call_llm.return_value = (
+        llm_response({"critiques": [critique_dict("note_a"), invalid]}),
+        {}
+    )
+
+    critiques, _, _, missed_notes = await critic_agent.run_batch(notes, "Section goal")
+
+    assert [c.note_id for c in critiques] == ["note_a"]
+    assert [note.note_id for note in missed_notes] == ["note_b"]
+
+@pytest.mark.asyncio
+async def test_run_batch_failed_request_returns_no_retries(critic_agent):
+    """When the LLM call fails there is no parsed response, so no notes are handed back for per-note retries."""
+    notes = [make_note("note_a"), make_note("note_b", "Sleep loss hurts recall.")]
+    critic_agent._call_llm.return_value = (None, None)
+
+    critiques, _, _, missed_notes = await critic_agent.run_batch(notes, "Section goal")
+
+    assert critiques == []
+    assert missed_notes == []
+
+@pytest.mark.asyncio
+async def test_run_batch_unparseable_response_returns_no_retries(critic_agent):
+    """A response that cannot be parsed is treated like a failed request."""
+    notes = [make_note("note_a"), make_note("note_b", "Sleep loss hurts recall.")]
+    response = MagicMock()
+    response.choices[0].message.content = "I could not critique these notes."
+    critic_agent._call_llm.return_value = (response, {})
+
+    critiques, _, _, missed_notes = await critic_agent.run_batch(notes, "Section goal")
+
+    assert critiques == []
+    assert missed_notes == []
+
+# --- Tests for the critique cache ---
+
+@pytest.mark.asyncio
+async def test_run_reuses_cached_critique_for_identical_note(critic_agent):
+    """A second note with the same content, source and goal is served from the cache under its own note_id."""
+    critic_agent._call_llm.return_value = (llm_response(critique_dict("note_a")), {})
+
+    first, _, _ = await critic_agent.run(make_note("note_a"), "Section goal")
+    second, details, _ = await critic_agent.run(make_note("note_b"), "Section goal")
+
+    assert first.note_id == "note_a"
+    assert second.note_id == "note_b"
+    assert second.overall_assessment == first.overall_assessment
+    assert details is None
+    critic_agent._call_llm.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_run_cache_misses_on_different_inputs(critic_agent):
+    """Changing the content, structured analysis or section goal misses the cache."""
+    critic_agent._call_llm.return_value = (llm_response(critique_dict("note_a")), {})
+    analysed = make_note("note_d")
+    analysed.structured_analysis = NoteAnalysis(core_argument="Sleep loss impairs memory.")
+
+    await critic_agent.run(make_note("note_a"), "Section goal")
+    await critic_agent.run(make_note("note_b", "Sleep loss hurts recall."), "Section goal")
+    await critic_agent.run(make_note("note_c"), "Another goal")
+    await critic_agent.run(analysed, "Section goal")
+
+    assert critic_agent._call_llm.await_count == 4
+
+def test_critique_cache_evicts_least_recently_used(critic_agent, monkeypatch):
+    """The cache keeps at most CRITIQUE_CACHE_SIZE entries and evicts the least recently used one."""
+    monkeypatch.setattr(notes_critic_agent, "CRITIQUE_CACHE_SIZE", 2)
+    notes = [make_note(f"note_{i}", f"Claim number {i} about sleep.") for i in range(3)]
+    critique = NotesCritiqueOutput(**critique_dict("note_0"))
+
+    critic_agent._store_cached_critique(notes[0], "Section goal", critique)
+    critic_agent._store_cached_critique(notes[1], "Section goal", critique)
+    # Touch note_0 so note_1 becomes the least recently used entry
+    assert critic_agent._get_cached_critique(notes[0], "Section goal") is not None
+    critic_agent._store_cached_critique(notes[2], "Section goal", critique)
+
+    assert len(critic_agent._critique_cache) == 2
+    assert critic_agent._get_cached_critique(notes[1], "Section goal") is None
+    assert critic_agent._get_cached_critique(notes[0], "Section goal").note_id == "note_0"
+    assert critic_agent._get_cached_critique(notes[2], "Section goal").note_id == "note_2"
+
+# --- Tests for the json_schema -> json_object fallback ---
+
+@pytest.fixture
+def dispatcher_critic_agent():
+    """A critic agent whose real _call_llm talks to a mocked ModelDispatcher."""
+    dispatcher = MagicMock()
+    dispatcher.dispatch = AsyncMock()
+    return NotesCriticAgent(model_dispatcher=dispatcher)
+
+def response_format_types(dispatch_mock: AsyncMock):
+    return [call.kwargs["response_format"]["type"] for call in dispatch_mock.await_args_list]
+
+@pytest.mark.asyncio
+async def test_transient_failure_keeps_schema_mode(dispatcher_critic_agent):
+    """A failed call (e.g. exhausted rate-limit retries) neither disables json_schema nor triggers an extra request."""
+    dispatch = dispatcher_critic_agent.model_dispatcher.dispatch
+    dispatch.return_value = (None, None)
+
+    critique, _, _ = await dispatcher_critic_agent.run(make_note("note_a"), "Section goal")
+
+    assert critique is None
+    assert dispatcher_critic_agent._json_schema_supported is True
+    assert response_format_types(dispatch) == ["json_schema"]
+
+@pytest.mark.asyncio
+async def test_non_schema_error_keeps_schema_mode(dispatcher_critic_agent):
+    """An unrelated dispatcher exception is handled as a failed call, not as a schema rejection."""
+    dispatch = dispatcher_critic_agent.model_dispatcher.dispatch
+    dispatch.side_effect = ConnectionError("Connection reset by peer")
+
+    critique, _, _ = await dispatcher_critic_agent.run(make_note("note_a"), "Section goal")
+
+    assert critique is None
+    assert dispatcher_critic_agent._json_schema_supported is True
+    assert response_format_types(dispatch) == ["json_schema"]
+
+@pytest.mark.asyncio
+async def test_schema_rejection_falls_back_to_json_object(dispatcher_critic_agent):
+    """A schema rejection retries the call with json_object and keeps using it for later critiques."""
+    dispatch = dispatcher_critic_agent.model_dispatcher.dispatch
+    dispatch.side_effect = [
+        Exception("Error code: 400 - This response_format type is unavailable now"),
+        (llm_response(critique_dict("note_a")), {}),
+        (llm_response(critique_dict("note_b")), {}),
+    ]
+
+    first, _, _ = await dispatcher_critic_agent.run(make_note("note_a"), "Section goal")
+    second, _, _ = await dispatcher_critic_agent.run(make_note("note_b", "Sleep loss hurts recall."), "Section goal")
+
+    assert first.note_id == "note_a"
+    assert second.note_id == "note_b"
+    assert dispatcher_critic_agent._json_schema_supported is False
+    assert response_format_types(dispatch) == ["json_schema", "json_object", "json_object"]
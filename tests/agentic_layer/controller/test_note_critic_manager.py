@@ -0,0 +1,160 @@
+import asyncio
+import pytest
+from typing import List, Optional
+from types import SimpleNamespace
+from unittest.mock import MagicMock, AsyncMock
+
+# Use absolute imports relative to the project root
+from ai_researcher.agentic_layer.schemas.notes import Note, NoteAnalysis, NotesCritiqueOutput, VerificationStatus
+from ai_researcher.agentic_layer.controller import note_critic_manager
+from ai_researcher.agentic_layer.controller.note_critic_manager import NoteCriticManager
+from tests.agentic_layer.note_factories import SOURCE, make_critique, make_note
+
+@pytest.fixture
+def manager():
+    return NoteCriticManager(MagicMock())
+
+# --- Tests for _local_source_alignment ---
+
+def test_local_alignment_passes_verbatim_note(manager):
+    """A note that restates its snippet passes locally."""
+    critique, suspect_claims = manager._local_source_alignment(make_note("note_a", SOURCE))
+    assert critique is not None
+    assert critique.verification_status == VerificationStatus.PASSED
+    assert critique.note_id == "note_a"
+    assert suspect_claims == []
+
+def test_local_alignment_flags_changed_number(manager):
+    """A note that only changes a figure is sent to the LLM with that claim flagged."""
+    altered = SOURCE.replace("40 percent", "90 percent")
+    critique, suspect_claims = manager._local_source_alignment(make_note("note_a", altered))
+    assert critique is None
+    assert suspect_claims == [altered]
+
+def test_local_alignment_flags_added_negation(manager):
+    """A note that negates its source is sent to the LLM."""
+    negated = SOURCE.replace("the study found that", "the study found no evidence that")
+    critique, suspect_claims = manager._local_source_alignment(make_note("note_a", negated))
+    assert critique is None
+    assert suspect_claims == [negated]
+
+@pytest.mark.parametrize("fabricated", ["Results were fabricated.", "It was retracted."])
+def test_local_alignment_flags_short_fabricated_claim(manager, fabricated):
+    """A short claim appended to verbatim content cannot be checked, so it is flagged rather than ignored."""
+    critique, suspect_claims = manager._local_source_alignment(make_note("note_a", f"{SOURCE} {fabricated}"))
+    assert critique is None
+    assert suspect_claims == [fabricated]
+
+def test_local_alignment_skips_structured_notes(manager):
+    """Notes with structured analysis always go to the LLM unflagged."""
+    note = make_note("note_a", SOURCE)
+    note.structured_analysis = NoteAnalysis(core_argument="Sleep loss impairs memory.")
+    assert manager._local_source_alignment(note) == (None, [])
+
+# --- Tests for the critique_all_notes worker/consumer pipeline ---
+
+class StubCriticAgent:
+    """Critic agent stub that critiques every note and records which batches were started or cancelled."""
+    def __init__(self, delays: Optional[dict] = None, block: bool = False):
+        self.delays = delays or {}
+        self.block = block
+        self.started: List[str] = []
+        self.cancelled: List[str] = []
+
+    format_goals = staticmethod(lambda goals: "None")
+    format_thoughts = staticmethod(lambda thoughts: "")
+
+    async def _critique(self, notes: List[Note]) -> List[NotesCritiqueOutput]:
+        first_id = notes[0].note_id
+        self.started.append(first_id)
+        try:
+            if self.block:
+                await asyncio.Event().wait()
+            await asyncio.sleep(self.delays.get(first_id, 0))
+        except asyncio.CancelledError:
+            self.cancelled.append(first_id)
+            raise
+        return [make_critique(note.note_id, f"after {first_id}") for note in notes]
+
+    async def run_batch(self, notes, section_goal, **kwargs):
+        critiques = await self._critique(notes)
+        return critiques, None, critiques[-1].scratchpad_update, []
+
+    async def run(self, note, section_goal, **kwargs):
+        critiques = await self._critique([note])
+        return critiques[0], None, critiques[0].scratchpad_update
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """A NoteCriticManager over six unchecked notes in batches of two, with two critique workers."""
+    monkeypatch.setattr(note_critic_manager, "STATUS_POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(note_critic_manager, "get_notes_critique_batch_size", lambda mission_id: 2)
+    monkeypatch.setattr(note_critic_manager, "get_max_concurrent_requests", lambda mission_id: 4)
+
+    mission = SimpleNamespace(status="running", user_request="Research sleep")
+    # Notes without snippets cannot be verified locally, so all of them reach the critic agent
+    notes = [make_note(f"note_{i}", f"Claim number {i} about sleep.", snippet=None) for i in range(6)]
+    context_manager = MagicMock()
+    context_manager.get_mission_context.return_value = mission
+    context_manager.get_active_goals.return_value = []
+    context_manager.get_recent_thoughts.return_value = []
+    context_manager.get_scratchpad.return_value = ""
+    context_manager.get_unchecked_notes.return_value = notes
+    context_manager.get_mission_semaphore.return_value = asyncio.Semaphore(10)
+    context_manager.update_note_verification = AsyncMock()
+    context_manager.update_scratchpad = AsyncMock()
+    context_manager.log_execution_step = AsyncMock()
+
+    controller = MagicMock()
+    controller.context_manager = context_manager
+    controller.maybe_semaphore = asyncio.Semaphore(10)
+    return SimpleNamespace(manager=NoteCriticManager(controller), controller=controller, mission=mission, notes=notes)
+
+@pytest.mark.asyncio
+async def test_critique_all_notes_drains_all_batches(pipeline):
+    """Every critique is written and the scratchpad update of the last batch wins, even if it finishes first."""
+    # The first batch finishes last, after the final batch has already been written
+    critic = StubCriticAgent(delays={"note_0": 0.05})
+    pipeline.controller.notes_critic_agent = critic
+
+    await asyncio.wait_for(pipeline.manager.critique_all_notes(mission_id="mission_1"), timeout=5)
+
+    context_manager = pipeline.controller.context_manager
+    written = sorted(call.kwargs["note_id"] for call in context_manager.update_note_verification.await_args_list)
+    assert written == [note.note_id for note in pipeline.notes]
+    context_manager.update_scratchpad.assert_awaited_once_with("mission_1", "after note_4")
+    assert context_manager.log_execution_step.await_args.kwargs["output_summary"] == "Critiqued 6 notes."
+
+@pytest.mark.asyncio
+async def test_critique_all_notes_cancels_workers_when_mission_stops(pipeline):
+    """Stopping the mission cancels in-flight critique workers instead of waiting for them."""
+    critic = StubCriticAgent(block=True)
+    pipeline.controller.notes_critic_agent = critic
+
+    task = asyncio.create_task(pipeline.manager.critique_all_notes(mission_id="mission_1"))
+    await asyncio.sleep(0.05)
+    pipeline.mission.status = "stopped"
+    await asyncio.wait_for(task, timeout=5)
+
+    assert sorted(critic.cancelled) == sorted(critic.started) == ["note_0", "note_2"]
+    pipeline.controller.context_manager.update_note_verification.assert_not_awaited()
+    pipeline.controller.context_manager.update_scratchpad.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_critique_all_notes_survives_consumer_failure(pipeline):
+    """If the consumer dies, workers blocked on the full result queue are cancelled rather than deadlocking."""
+    critic = StubCriticAgent()
+    pipeline.controller.notes_critic_agent = critic
+    context_manager = pipeline.controller.context_manager
+    # Six batches: more than the two-slot result queue can hold once the consumer is gone
+    context_manager.get_unchecked_notes.return_value = [
+        make_note(f"note_{i}", f"Claim number {i} about sleep.", snippet=None) for i in range(12)
+    ]
+    context_manager.update_note_verification.side_effect = RuntimeError("database unavailable")
+
+    await asyncio.wait_for(pipeline.manager.critique_all_notes(mission_id="mission_1"), timeout=5)
+
+    # The workers stalled on the full queue were cancelled before taking the remaining batches
+    assert len(critic.started) < 6
+    context_manager.update_note_verification.assert_awaited_once()
+    assert context_manager.log_execution_step.await_args.kwargs["output_summary"] == "Critiqued 0 notes."
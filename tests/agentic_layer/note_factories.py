@@ -0,0 +1,38 @@
+"""Shared Note and critique builders for the agentic layer tests."""
+from typing import Optional
+
+# Use absolute imports relative to the project root
+from ai_researcher.agentic_layer.schemas.notes import (
+    Note, NotesCritiqueOutput, SourceAlignmentResult, SourceMetadata, VerificationStatus
+)
+
+SOURCE = (
+    "In a controlled trial of healthy adults, the study found that one night of sleep deprivation "
+    "reduced memory consolidation by 40 percent compared with rested participants."
+)
+
+def make_note(
+    note_id: str,
+    content: str = "Sleep deprivation impairs memory.",
+    snippet: Optional[str] = SOURCE,
+    status: VerificationStatus = VerificationStatus.UNCHECKED
+) -> Note:
+    return Note(
+        note_id=note_id,
+        content=content,
+        source_type="document",
+        source_id="doc_1",
+        source_metadata=SourceMetadata(title="Sleep Study", snippet=snippet),
+        verification_status=status
+    )
+
+def make_critique(note_id: str, scratchpad_update: str = "") -> NotesCritiqueOutput:
+    return NotesCritiqueOutput(
+        note_id=note_id,
+        overall_assessment="Checked",
+        accuracy_score=0.9,
+        source_alignment=SourceAlignmentResult(aligned=True, coverage_percentage=0.9),
+        revise_needed=False,
+        verification_status=VerificationStatus.PASSED,
+        scratchpad_update=scratchpad_update
+    )
@@ -0,0 +1,114 @@
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, AsyncMock
+
+# Use absolute imports relative to the project root
+from ai_researcher.agentic_layer.schemas.notes import VerificationStatus
+from ai_researcher.agentic_layer import async_context_manager
+from ai_researcher.agentic_layer.async_context_manager import AsyncContextManager, MissionContext
+from tests.agentic_layer.note_factories import make_critique, make_note
+
+MISSION_ID = "mission_1"
+
+@pytest.fixture
+def context_manager(monkeypatch):
+    """An AsyncContextManager holding one mission, with database and WebSocket side effects mocked out."""
+    @asynccontextmanager
+    async def mock_get_async_db():
+        yield MagicMock()
+
+    mock_crud = MagicMock()
+    mock_crud.update_mission_context = AsyncMock()
+    monkeypatch.setattr(async_context_manager, "get_async_db", mock_get_async_db)
+    monkeypatch.setattr(async_context_manager, "crud", mock_crud)
+    monkeypatch.setattr(async_context_manager, "send_notes_update", AsyncMock())
+
+    manager = AsyncContextManager()
+    manager._missions[MISSION_ID] = MissionContext(mission_id=MISSION_ID, user_request="Research sleep")
+    manager._process_note_for_document_group = AsyncMock()
+    manager.append_critique_history = AsyncMock()
+    return manager
+
+def unchecked_ids(manager: AsyncContextManager):
+    return sorted(note.note_id for note in manager.get_unchecked_notes(MISSION_ID))
+
+# --- Tests for the unchecked-note index ---
+
+@pytest.mark.asyncio
+async def test_verified_note_leaves_unchecked_index(context_manager):
+    """Added notes are indexed until the critic verifies them."""
+    await context_manager.add_note(MISSION_ID, make_note("note_a"))
+    await context_manager.add_notes(MISSION_ID, [make_note("note_b"), make_note("note_c", status=VerificationStatus.PASSED)])
+    assert unchecked_ids(context_manager) == ["note_a", "note_b"]
+
+    await context_manager.update_note_verification(MISSION_ID, "note_a", VerificationStatus.PASSED, "Looks good")
+
+    assert unchecked_ids(context_manager) == ["note_b"]
+
+@pytest.mark.asyncio
+async def test_reset_to_unchecked_readds_note(context_manager):
+    """Setting a verified note back to UNCHECKED puts it back in the index."""
+    await context_manager.add_note(MISSION_ID, make_note("note_a"))
+    await context_manager.update_note_verification(MISSION_ID, "note_a", VerificationStatus.REVISE, "Fix the numbers")
+    assert unchecked_ids(context_manager) == []
+
+    await context_manager.update_note_verification(MISSION_ID, "note_a", VerificationStatus.UNCHECKED, "Revised")
+
+    assert unchecked_ids(context_manager) == ["note_a"]
+
+@pytest.mark.asyncio
+async def test_remove_notes_drops_them_from_index(context_manager):
+    """Removed notes are no longer reported as unchecked, and later additions are still tracked."""
+    await context_manager.add_notes(MISSION_ID, [make_note("note_a"), make_note("note_b")])
+
+    await context_manager.remove_notes(MISSION_ID, ["note_a"])
+    await context_manager.add_note(MISSION_ID, make_note("note_c"))
+
+    assert unchecked_ids(context_manager) == ["note_b", "note_c"]
+
+@pytest.mark.asyncio
+async def test_replaced_notes_list_rebuilds_index(context_manager):
+    """Replacing mission.notes directly (as note truncation does) rebuilds the index from the new list."""
+    await context_manager.add_notes(MISSION_ID, [make_note("note_a"), make_note("note_b"), make_note("note_c")])
+    assert unchecked_ids(context_manager) == ["note_a", "note_b", "note_c"]
+
+    mission = context_manager.get_mission_context(MISSION_ID)
+    mission.notes = [note for note in mission.notes if note.note_id != "note_b"]
+
+    assert unchecked_ids(context_manager) == ["note_a", "note_c"]
+
+# --- Tests for note critique history ---
+
+@pytest.mark.asyncio
+async def test_update_note_verification_keeps_latest_critique(context_manager):
+    """Each critique replaces latest_critique, bumps critique_count and is handed to the history writer."""
+    await context_manager.add_note(MISSION_ID, make_note("note_a"))
+    first, second = make_critique("note_a"), make_critique("note_a")
+
+    await context_manager.update_note_verification(MISSION_ID, "note_a", VerificationStatus.REVISE, "Fix it", critique_result=first)
+    await context_manager.update_note_verification(MISSION_ID, "note_a", VerificationStatus.PASSED, "Good", critique_result=second)
+
+    note = context_manager.get_notes(MISSION_ID)[0]
+    assert note.latest_critique is second
+    assert note.critique_count == 2
+    written = [call.args[:3] for call in context_manager.append_critique_history.await_args_list]
+    assert written == [(MISSION_ID, "note_a", first), (MISSION_ID, "note_a", second)]
+
+@pytest.mark.asyncio
+async def test_critique_history_shares_the_context_update_commit(context_manager):
+    """Critique history goes to the note history table in the same session as the context update, not the execution log."""
+    del context_manager.append_critique_history  # Use the real history writer
+    mock_crud = async_context_manager.crud
+    await context_manager.add_note(MISSION_ID, make_note("note_a"))
+    mock_crud.update_mission_context.reset_mock()
+
+    await context_manager.update_note_verification(
+        MISSION_ID, "note_a", VerificationStatus.PASSED, "Good", critique_result=make_critique("note_a")
+    )
+
+    history_call = mock_crud.add_note_history_entry.call_args
+    assert history_call.kwargs["note_id"] == "note_a"
+    assert history_call.kwargs["record_type"] == "critique"
+    assert history_call.kwargs["record"]["overall_assessment"] == "Checked"
+    assert history_call.kwargs["db"] is mock_crud.update_mission_context.await_args.args[0]
+    mock_crud.create_execution_log.assert_not_called()
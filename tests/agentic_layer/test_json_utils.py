@@ -11,6 +11,7 @@ from ai_researcher.agentic_layer.utils.json_utils import (
     parse_json_string_recursively,
     sanitize_json_string,
     parse_llm_json_response,
+    fast_json_loads,
     prepare_for_pydantic_validation,
     extract_non_schema_fields,
     filter_null_values_from_list
@@ -106,5 +107,23 @@ class TestJsonUtils(unittest.TestCase):
         except Exception as e:
             self.fail(f"Failed to create ReflectionOutput object: {e}")
 
+    def test_fast_json_loads(self):
+        """Test that fast_json_loads parses standard JSON and falls back to json.loads for lenient input."""
+        # Standard JSON
+        self.assertEqual(fast_json_loads('{"a": [1, 2, {"b": null}]}'), {"a": [1, 2, {"b": None}]})
+        
+        # NaN is rejected by orjson but accepted by the stdlib parser
+        result = fast_json_loads('{"score": NaN}')
+        self.assertNotEqual(result["score"], result["score"])
+        
+        # Invalid JSON still raises json.JSONDecodeError
+        with self.assertRaises(json.JSONDecodeError):
+            fast_json_loads('{"a": ')
+    
+    def test_parse_llm_json_response_with_code_fence(self):
+        """Test that parse_llm_json_response handles fenced JSON."""
+        result = parse_llm_json_response('```json\n{"note_id": "note_1", "accuracy_score": 0.9}\n```')
+        self.assertEqual(result, {"note_id": "note_1", "accuracy_score": 0.9})
+
 if __name__ == "__main__":
     unittest.main()
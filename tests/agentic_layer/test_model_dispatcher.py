@@ -0,0 +1,63 @@
+import pytest
+
+# Use absolute imports relative to the project root
+from ai_researcher.agentic_layer.model_dispatcher import ModelDispatcher
+
+def make_settings(openrouter_key: str = "or-key-1") -> dict:
+    return {
+        "ai_endpoints": {
+            "providers": {
+                "openrouter": {"enabled": True, "api_key": openrouter_key, "base_url": "https://openrouter.ai/api/v1"},
+                "local": {"enabled": True, "api_key": "local-key", "base_url": "http://localhost:8000/v1"},
+            }
+        }
+    }
+
+@pytest.fixture
+def dispatcher():
+    return ModelDispatcher(user_settings=make_settings())
+
+# --- Tests for client caching and the shared connection pool ---
+
+def test_client_reused_while_credentials_unchanged(dispatcher):
+    """The cached client is returned as long as base_url and api_key match."""
+    first = dispatcher._get_or_create_client("openrouter", make_settings())
+    second = dispatcher._get_or_create_client("openrouter", make_settings())
+
+    assert first is not None
+    assert second is first
+
+def test_new_client_when_api_key_changes(dispatcher):
+    """A changed API key replaces the cached client, which keeps using the shared pool."""
+    old_client = dispatcher._get_or_create_client("openrouter", make_settings())
+
+    new_client = dispatcher._get_or_create_client("openrouter", make_settings("or-key-2"))
+
+    assert new_client is not old_client
+    assert new_client.api_key == "or-key-2"
+    assert dispatcher.clients["openrouter"] is new_client
+    assert new_client._client is old_client._client is dispatcher.http_client
+
+def test_provider_clients_share_one_http_client(dispatcher):
+    """Every provider client sends its requests through the dispatcher's single connection pool."""
+    openrouter = dispatcher._get_or_create_client("openrouter", make_settings())
+    local = dispatcher._get_or_create_client("local", make_settings())
+
+    assert openrouter is not local
+    assert openrouter._client is local._client is dispatcher.http_client
+
+@pytest.mark.asyncio
+async def test_cleanup_closes_pool_and_recreates_it(dispatcher):
+    """After cleanup the closed pool is dropped and the next client gets a fresh one."""
+    old_client = dispatcher._get_or_create_client("openrouter", make_settings())
+    old_pool = dispatcher.http_client
+
+    await dispatcher.cleanup()
+
+    assert old_pool.is_closed
+    assert dispatcher.clients == {}
+    new_client = dispatcher._get_or_create_client("openrouter", make_settings())
+    assert new_client is not old_client
+    assert new_client._client is dispatcher.http_client
+    assert dispatcher.http_client is not old_pool
+    assert not dispatcher.http_client.is_closed
@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from ai_researcher.agentic_layer.schemas.notes import Note, SourceMetadata
+
+class TestSourceMetadata(unittest.TestCase):
+    """Test cases for the SourceMetadata schema."""
+
+    def test_unknown_keys_move_to_extras(self):
+        """Test that undeclared keys are kept in extras rather than as attributes."""
+        metadata = SourceMetadata(title="Paper", page_number=4, original_snippet="text")
+        self.assertEqual(metadata.title, "Paper")
+        self.assertEqual(metadata.extras, {"page_number": 4, "original_snippet": "text"})
+        self.assertFalse(hasattr(metadata, "page_number"))
+
+    def test_dump_keeps_extras_nested(self):
+        """Test that extras serialize under the extras key and round-trip."""
+        metadata = SourceMetadata(url="https://example.com", page_number=4)
+        dumped = metadata.model_dump(mode='json')
+        self.assertEqual(dumped["extras"], {"page_number": 4})
+        self.assertNotIn("page_number", dumped)
+        self.assertEqual(SourceMetadata(**dumped), metadata)
+
+    def test_legacy_flat_keys_load_into_extras(self):
+        """Test that stored metadata with flat source-specific keys merges them into extras."""
+        metadata = SourceMetadata(**{"title": "Page", "full_text": "body", "extras": {"page_number": 4}})
+        self.assertEqual(metadata.extras, {"page_number": 4, "full_text": "body"})
+
+    def test_lineage_fields(self):
+        """Test that internal-note lineage is exposed as declared fields."""
+        metadata = SourceMetadata(synthesized_from_notes=["note_1", "note_2"])
+        self.assertEqual(metadata.synthesized_from_notes, ["note_1", "note_2"])
+        self.assertEqual(metadata.extras, {})
+
+class TestNoteHistory(unittest.TestCase):
+    """Test cases for the latest-only note history fields."""
+
+    def test_legacy_history_lists_fold_into_latest(self):
+        """Test that stored revision_history/critique_results lists load as latest entry plus count."""
+        revisions = [
+            {"agent_name": "ResearchAgent", "change_type": "content", "original_value": "a", "new_value": "b"},
+            {"agent_name": "WritingAgent", "change_type": "content", "original_value": "b", "new_value": "c"},
+        ]
+        note = Note(content="c", source_type="web", source_id="https://example.com",
+                    revision_history=revisions, critique_results=[])
+        self.assertEqual(note.revision_count, 2)
+        self.assertEqual(note.latest_revision.agent_name, "WritingAgent")
+        self.assertEqual(note.critique_count, 0)
+        self.assertIsNone(note.latest_critique)
+        self.assertNotIn("revision_history", note.model_dump())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the path so we can import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from ai_researcher.agentic_layer.utils.source_alignment import (
+    tokenize,
+    build_ngram_set,
+    ngram_coverage,
+    split_claims,
+    claim_coverages,
+    missing_key_tokens
+)
+
+class TestSourceAlignment(unittest.TestCase):
+
+    def test_tokenize(self):
+        """Test that tokenize lowercases and strips punctuation."""
+        self.assertEqual(tokenize("Hello, World! It's 2024."), ["hello", "world", "it", "s", "2024"])
+        self.assertEqual(tokenize(None), [])
+        self.assertEqual(tokenize("   "), [])
+
+    def test_build_ngram_set(self):
+        """Test that build_ngram_set returns word n-grams and handles short inputs."""
+        self.assertEqual(build_ngram_set(["a", "b", "c", "d"], 3), {("a", "b", "c"), ("b", "c", "d")})
+        self.assertEqual(build_ngram_set(["a", "b"], 3), set())
+
+    def test_ngram_coverage_verbatim(self):
+        """Test that a note copied from its source has full coverage regardless of casing/punctuation."""
+        source = "The study found that sleep deprivation reduces memory consolidation by 40 percent in adults."
+        note = "sleep deprivation reduces memory consolidation by 40 percent"
+        self.assertEqual(ngram_coverage(note, source), 1.0)
+
+    def test_ngram_coverage_unsupported(self):
+        """Test that a note making claims not in the source has low coverage."""
+        source = "The study found that sleep deprivation reduces memory consolidation by 40 percent in adults."
+        note = "Caffeine fully reverses the effects of sleep loss on long term memory."
+        self.assertLess(ngram_coverage(note, source), 0.5)
+
+    def test_ngram_coverage_short_or_missing(self):
+        """Test that texts too short to judge, or a missing source, give zero coverage."""
+        self.assertEqual(ngram_coverage("Yes", "Yes it is"), 0.0)
+        self.assertEqual(ngram_coverage("a long enough note here", None), 0.0)
+
+    def test_split_claims(self):
+        """Test that text is split into stripped sentences on punctuation and line breaks."""
+        text = "Sleep matters. Does it help memory?  Yes!\nSee the appendix"
+        self.assertEqual(split_claims(text), ["Sleep matters.", "Does it help memory?", "Yes!", "See the appendix"])
+        self.assertEqual(split_claims(None), [])
+
+    def test_claim_coverages_flags_unsupported_claim(self):
+        """Test that only the claim missing from the source gets low coverage, and short claims count as unsupported."""
+        source = "The study found that sleep deprivation reduces memory consolidation by 40 percent in adults."
+        note = (
+            "Sleep deprivation reduces memory consolidation by 40 percent. "
+            "Caffeine fully reverses the effects of sleep loss. Notably."
+        )
+        coverages = claim_coverages(note, source)
+        self.assertEqual(coverages, [
+            ("Sleep deprivation reduces memory consolidation by 40 percent.", 1.0),
+            ("Caffeine fully reverses the effects of sleep loss.", 0.0),
+            ("Notably.", 0.0)
+        ])
+
+    def test_claim_coverages_short_fabricated_claim(self):
+        """Test that a fabricated claim too short to check is reported rather than skipped."""
+        source = "The study found that sleep deprivation reduces memory consolidation by 40 percent in adults."
+        note = "Sleep deprivation reduces memory consolidation by 40 percent. It was retracted."
+        self.assertEqual(claim_coverages(note, source)[-1], ("It was retracted.", 0.0))
+
+    def test_missing_key_tokens(self):
+        """Test that changed numbers and added negations are reported, and matching ones are not."""
+        source = "The study found that sleep deprivation reduces memory consolidation by 40 percent in adults."
+        self.assertEqual(missing_key_tokens("Sleep deprivation reduces memory consolidation by 90 percent.", source), {"90"})
+        self.assertEqual(missing_key_tokens("Sleep deprivation doesn't reduce memory consolidation.", source), {"t"})
+        self.assertEqual(missing_key_tokens("Sleep deprivation reduces memory consolidation by 40 percent.", source), set())
+        self.assertEqual(missing_key_tokens(None, source), set())
+
+if __name__ == "__main__":
+    unittest.main()